@@ -5,45 +5,85 @@ Copyright 2025 Ben Mensi
 Licensed under the Apache License, Version 2.0
 """
 
+import importlib
 import logging
-from typing import Optional
+import sys
+from typing import List, Optional
 
 import typer
-import yaml
+from typer.core import TyperGroup
+
+from life.commands import SUBCOMMANDS
+from life.commands._ctx import CtxState
+from life.launcher import APP_HELP, VERSION_LINE
+
+
+class LazyGroup(TyperGroup):
+    """Root command group that imports subcommand modules on demand.
+
+    Invoking one verb doesn't pay the import cost of every other verb
+    (and their dependencies).
+    """
+
+    def list_commands(self, ctx: typer.Context) -> List[str]:
+        pending = [name for name in SUBCOMMANDS if name not in self.commands]
+        return [*super().list_commands(ctx), *pending]
+
+    def get_command(self, ctx: typer.Context, cmd_name: str):
+        if cmd_name not in self.commands and cmd_name in SUBCOMMANDS:
+            module = importlib.import_module(SUBCOMMANDS[cmd_name][0])
+            command = typer.main.get_command(module.app)
+            command.name = cmd_name
+            self.add_command(command, cmd_name)
+        return super().get_command(ctx, cmd_name)
 
-from life import __version__
-from life.commands import config, email, jobs, pipeline, run, script, today
-from life.config import load_config
 
 # Initialize main app
 app = typer.Typer(
     name="life",
-    help="Lightweight, stateful, CLI-first orchestrator for personal data pipelines",
+    help=APP_HELP,
     no_args_is_help=True,
+    cls=LazyGroup,
 )
 
-# Add subcommands
-app.add_typer(today.app, name="today")
-app.add_typer(email.app, name="email")
-app.add_typer(config.app, name="config")
-app.add_typer(run.app, name="run")
-app.add_typer(jobs.app, name="jobs")
-app.add_typer(pipeline.app, name="pipeline")
-app.add_typer(script.app, name="script")
+logger = logging.getLogger(__name__)
 
 # Note: state is created fresh in main_callback, not at module level
 
 
+# Commands that never load config
+NO_CONFIG_COMMANDS = frozenset({"version"})
+
+# Job runner commands that fall back to defaults when no config file exists
+OPTIONAL_CONFIG_COMMANDS = frozenset({"today", "email", "run", "jobs", "pipeline", "script"})
+
+# String values treated as False when typer hands us a string flag
+_FALSY = frozenset({"false", "0", "no", ""})
+
+LOG_FORMAT = "%(asctime)s [%(levelname)s] %(message)s"
+LOG_DATEFMT = "%Y-%m-%d %H:%M:%S"
+
+
 def setup_logging(verbose: bool = False):
-    """Configure logging for the CLI."""
-    level = logging.DEBUG if verbose else logging.INFO
+    """Configure logging for the CLI.
+
+    No-op if the root logger already has handlers (e.g. main() called
+    repeatedly from tests or a REPL), matching logging.basicConfig.
+    """
+    if logging.getLogger().handlers:
+        return
     logging.basicConfig(
-        level=level,
-        format="%(asctime)s [%(levelname)s] %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
+        level=logging.DEBUG if verbose else logging.INFO,
+        format=LOG_FORMAT,
+        datefmt=LOG_DATEFMT,
     )
 
 
+def _as_bool(value) -> bool:
+    """Normalize a flag value; older typer versions (< 0.10) may pass strings."""
+    return value if isinstance(value, bool) else str(value).lower() not in _FALSY
+
+
 @app.callback()
 def main_callback(
     ctx: typer.Context,
@@ -71,13 +111,10 @@ def main_callback(
     Manages sync, merge, process, and status tasks defined in a YAML config file.
     """
     # Create fresh state for each invocation (not module-level to avoid pollution)
-    # Note: older typer versions (< 0.10) may pass booleans as strings
-    if isinstance(dry_run, str):
-        dry_run = dry_run.lower() not in ("false", "0", "no", "")
-    if isinstance(verbose, str):
-        verbose = verbose.lower() not in ("false", "0", "no", "")
+    dry_run = _as_bool(dry_run)
+    verbose = _as_bool(verbose)
 
-    state = {"config": {}, "dry_run": dry_run, "verbose": verbose}
+    config = {}
 
     # Setup logging
     setup_logging(verbose)
@@ -85,38 +122,39 @@ def main_callback(
     # Load config if a subcommand is being invoked
     # Some commands don't need config (version)
     # Job runner commands (run, jobs, today) can work with defaults if no config
-    commands_without_config = ["version"]
-    commands_with_optional_config = ["today", "email", "run", "jobs", "pipeline", "script"]
-    if ctx.invoked_subcommand and ctx.invoked_subcommand not in commands_without_config:
+    if ctx.invoked_subcommand and ctx.invoked_subcommand not in NO_CONFIG_COMMANDS:
+        # Imported here so commands that skip config never load PyYAML
+        from life.config import ConfigParseError, load_config
+
         try:
             config = load_config(config_path)
-            state["config"] = config
 
-            if verbose:
-                logging.debug(f"Loaded config from: {config_path or 'default location'}")
-                logging.debug(f"Dry run: {dry_run}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Loaded config from: %s", config_path or "default location")
+                logger.debug("Dry run: %s", dry_run)
 
         except FileNotFoundError as e:
             # Some commands can work without config (use defaults)
-            if ctx.invoked_subcommand in commands_with_optional_config:
-                if verbose:
-                    cmd = ctx.invoked_subcommand
-                    logging.debug(f"No config file found, using defaults for '{cmd}' command")
+            if ctx.invoked_subcommand in OPTIONAL_CONFIG_COMMANDS:
+                logger.debug(
+                    "No config file found, using defaults for '%s' command",
+                    ctx.invoked_subcommand,
+                )
             else:
                 typer.echo(f"Error: {e}", err=True)
                 raise typer.Exit(1)
-        except yaml.YAMLError as e:
+        except ConfigParseError as e:
             typer.echo(f"Error: {e}", err=True)
             raise typer.Exit(1)
 
-    # Store state in context for subcommands
-    ctx.obj = state
+    # Store state in context for subcommands (read via commands._ctx.ctx_state)
+    ctx.obj = CtxState(config=config, dry_run=dry_run, verbose=verbose)
 
 
 @app.command()
 def version():
     """Show version information."""
-    typer.echo(f"life version {__version__}")
+    sys.stdout.write(VERSION_LINE)
 
 
 def main():
@@ -4,3 +4,16 @@ Command modules for Life-CLI.
 Copyright 2025 Ben Mensi
 Licensed under the Apache License, Version 2.0
 """
+
+# Subcommand name -> (module defining its Typer `app`, one-line help).
+# Kept free of imports so the launcher can render help without loading Typer;
+# the help text must match each module's `typer.Typer(help=...)`.
+SUBCOMMANDS = {
+    "today": ("life.commands.today", "Daily note creation and reflection"),
+    "email": ("life.commands.email", "Send emails via MS Graph or Gmail"),
+    "config": ("life.commands.config", "Manage and validate configuration"),
+    "run": ("life.commands.run", "Run a job by ID"),
+    "jobs": ("life.commands.jobs", "List and inspect job definitions"),
+    "pipeline": ("life.commands.pipeline", "Daily data pipeline operations"),
+    "script": ("life.commands.script", "Run quarantined bash scripts with TTL enforcement"),
+}
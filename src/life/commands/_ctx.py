@@ -0,0 +1,25 @@
+"""
+Shared access to the root callback's state for Life-CLI commands.
+
+Copyright 2025 Ben Mensi
+Licensed under the Apache License, Version 2.0
+"""
+
+from typing import Any, Dict, NamedTuple
+
+import typer
+
+
+class CtxState(NamedTuple):
+    """Per-invocation state stored on ctx.obj by the root callback."""
+
+    config: Dict[str, Any]
+    dry_run: bool
+    verbose: bool
+
+
+def ctx_state(ctx: typer.Context) -> CtxState:
+    """Get the invocation state, with defaults when a command runs standalone."""
+    if ctx.obj is None:
+        return CtxState(config={}, dry_run=False, verbose=False)
+    return ctx.obj
@@ -0,0 +1,21 @@
+"""
+Shared path helpers for Life-CLI commands.
+
+Copyright 2025 Ben Mensi
+Licensed under the Apache License, Version 2.0
+"""
+
+from pathlib import Path
+
+# Jobs are always read from the package's jobs/ directory (no user overrides)
+JOBS_DIR = Path(__file__).parent.parent / "jobs"
+
+
+def get_jobs_dir() -> Path:
+    """Get jobs directory from package location."""
+    return JOBS_DIR
+
+
+def expand_path(path: str) -> Path:
+    """Expand ~ in a configured path."""
+    return Path(path).expanduser()
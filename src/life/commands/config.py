@@ -11,6 +11,7 @@ import logging
 
 import typer
 
+from life.commands._ctx import ctx_state
 from life.config_manager import full_validation, get_task_summary, validate_tools
 from life.registry import is_tool_installed, list_tools
 
@@ -28,7 +29,7 @@ def validate(ctx: typer.Context):
     - Tool availability (checks if binaries exist on PATH)
     - Configuration consistency
     """
-    config = ctx.obj.get("config", {})
+    config = ctx_state(ctx).config
 
     typer.echo("Validating configuration...")
     typer.echo()
@@ -75,7 +76,7 @@ def check(ctx: typer.Context):
 
     Quick check for tool availability without full validation.
     """
-    config = ctx.obj.get("config", {})
+    config = ctx_state(ctx).config
 
     typer.echo("Checking tool availability...")
     typer.echo()
@@ -109,7 +110,7 @@ def list_tasks(ctx: typer.Context):
     Shows tasks organized by command type (sync, merge, process, status)
     with tool dependencies for each task.
     """
-    config = ctx.obj.get("config", {})
+    config = ctx_state(ctx).config
 
     typer.echo("Configured Tasks:")
     typer.echo()
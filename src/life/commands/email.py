@@ -7,26 +7,25 @@ Copyright 2025 Ben Mensi
 Licensed under the Apache License, Version 2.0
 """
 
+import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Dict, FrozenSet, Optional, Tuple
 
 import typer
 
-from life.job_runner import InvalidJobNameError, run_job
+from life.commands._ctx import ctx_state
+from life.commands._paths import expand_path, get_jobs_dir
+from life.job_runner import run_job
 
 app = typer.Typer(help="Send emails via MS Graph or Gmail")
 
 
-def _get_jobs_dir() -> Path:
-    """Get jobs directory from package location."""
-    return Path(__file__).parent.parent / "jobs"
-
-
 def _get_event_log(config: dict) -> Path:
     """Get event log path from config or default."""
     jobs_config = config.get("jobs", {})
     event_log = jobs_config.get("event_log", "~/.life/events.jsonl")
-    return Path(event_log).expanduser()
+    return expand_path(event_log)
 
 
 def _get_default_account(config: dict) -> Optional[str]:
@@ -35,6 +34,14 @@ def _get_default_account(config: dict) -> Optional[str]:
     return email_config.get("account")
 
 
+@lru_cache(maxsize=8)
+def _account_sets(
+    gmail_accounts: Tuple[str, ...], msgraph_accounts: Tuple[str, ...]
+) -> Tuple[FrozenSet[str], FrozenSet[str]]:
+    """Index the configured account lists as frozensets (memoized per lists)."""
+    return frozenset(gmail_accounts), frozenset(msgraph_accounts)
+
+
 def _get_provider_for_account(account: str, config: dict) -> str:
     """Determine email provider for account from config.
 
@@ -43,8 +50,10 @@ def _get_provider_for_account(account: str, config: dict) -> str:
     Defaults to msgraph for backwards compatibility.
     """
     email_config = config.get("email", {})
-    gmail_accounts = email_config.get("gmail_accounts", [])
-    msgraph_accounts = email_config.get("msgraph_accounts", [])
+    gmail_accounts, msgraph_accounts = _account_sets(
+        tuple(email_config.get("gmail_accounts") or ()),
+        tuple(email_config.get("msgraph_accounts") or ()),
+    )
     if account in gmail_accounts:
         return "gmail"
     if account in msgraph_accounts:
@@ -53,6 +62,37 @@ def _get_provider_for_account(account: str, config: dict) -> str:
     return "msgraph"
 
 
+# Template extensions in precedence order (.md wins over .html)
+_TEMPLATE_EXTENSIONS = (".md", ".html")
+
+
+@lru_cache(maxsize=4)
+def _template_index(templates_dir: str, mtime_ns: int) -> Dict[str, str]:
+    """Map template stem -> full path for one scan of templates_dir.
+
+    Cached per (directory, mtime_ns): adding or removing a template changes
+    the directory mtime and invalidates the entry.
+    """
+    found: Dict[str, Dict[str, str]] = {}
+    with os.scandir(templates_dir) as entries:
+        for entry in entries:
+            stem, ext = os.path.splitext(entry.name)
+            if ext in _TEMPLATE_EXTENSIONS:
+                found.setdefault(stem, {})[ext] = entry.path
+    return {
+        stem: next(paths[ext] for ext in _TEMPLATE_EXTENSIONS if ext in paths)
+        for stem, paths in found.items()
+    }
+
+
+def _get_template_index(templates_dir: str) -> Dict[str, str]:
+    """Get the template index, or an empty index if the directory is missing."""
+    try:
+        return _template_index(templates_dir, os.stat(templates_dir).st_mtime_ns)
+    except OSError:
+        return {}
+
+
 def _resolve_template_path(template: str, config: dict) -> str:
     """Resolve template name to full path.
 
@@ -64,28 +104,33 @@ def _resolve_template_path(template: str, config: dict) -> str:
     """
     # Check if already a path (contains separator or starts with ~)
     if "/" in template or "\\" in template or template.startswith("~"):
-        return str(Path(template).expanduser())
+        return os.path.expanduser(template)
 
     # Get templates directory from config or default
     email_config = config.get("email", {})
     templates_dir = email_config.get("templates_dir", "~/.life/templates/email")
-    templates_path = Path(templates_dir).expanduser()
+    templates_path = os.path.expanduser(templates_dir)
 
     # If template already has extension, use it directly
-    if template.endswith(".md") or template.endswith(".html"):
-        return str(templates_path / template)
+    if template.endswith(_TEMPLATE_EXTENSIONS):
+        return os.path.join(templates_path, template)
 
-    # Try .md first, then .html (documented precedence)
-    md_path = templates_path / f"{template}.md"
-    if md_path.exists():
-        return str(md_path)
+    # Look up by name; .md is preferred over .html (documented precedence)
+    resolved = _get_template_index(templates_path).get(template)
+    if resolved:
+        return resolved
 
-    html_path = templates_path / f"{template}.html"
-    if html_path.exists():
-        return str(html_path)
+    # Default to .md path (commands report it as not found via _require_file)
+    return os.path.join(templates_path, f"{template}.md")
 
-    # Default to .md path (processor will give clear error if missing)
-    return str(templates_path / f"{template}.md")
+
+def _require_file(path: str, label: str) -> str:
+    """Resolve path to an absolute path, exiting with an error if it doesn't exist."""
+    try:
+        return str(Path(path).expanduser().resolve(strict=True))
+    except OSError:
+        typer.secho(f"Error: {label} not found: {path}", fg=typer.colors.RED, err=True)
+        raise typer.Exit(1)
 
 
 @app.command()
@@ -102,8 +147,9 @@ def send(
     Either --body or --template must be provided.
     Template files use YAML frontmatter for subject.
     """
-    config = ctx.obj.get("config", {}) if ctx.obj else {}
-    dry_run = ctx.obj.get("dry_run", False) if ctx.obj else False
+    state = ctx_state(ctx)
+    config = state.config
+    dry_run = state.dry_run
 
     # Get account from option or config
     account = account or _get_default_account(config)
@@ -111,6 +157,7 @@ def send(
         typer.secho(
             "Error: No account specified. Use --account or set email.account in config.",
             fg=typer.colors.RED,
+            err=True,
         )
         raise typer.Exit(1)
 
@@ -119,6 +166,7 @@ def send(
         typer.secho(
             "Error: Either --body or --template must be provided.",
             fg=typer.colors.RED,
+            err=True,
         )
         raise typer.Exit(1)
 
@@ -127,12 +175,13 @@ def send(
         typer.secho(
             "Error: --subject is required when using --body.",
             fg=typer.colors.RED,
+            err=True,
         )
         raise typer.Exit(1)
 
     # Resolve template path (e.g., "reminder" → ~/.life/templates/email/reminder.md)
     if template:
-        template = _resolve_template_path(template, config)
+        template = _require_file(_resolve_template_path(template, config), "Template")
 
     # Determine provider from config
     provider = _get_provider_for_account(account, config)
@@ -152,7 +201,7 @@ def send(
             result = run_job(
                 "email.send_templated",
                 dry_run=False,
-                jobs_dir=_get_jobs_dir(),
+                jobs_dir=get_jobs_dir(),
                 event_log=_get_event_log(config),
                 variables={
                     "account": account,
@@ -166,7 +215,7 @@ def send(
             result = run_job(
                 "email.send",
                 dry_run=False,
-                jobs_dir=_get_jobs_dir(),
+                jobs_dir=get_jobs_dir(),
                 event_log=_get_event_log(config),
                 variables={
                     "account": account,
@@ -180,19 +229,16 @@ def send(
         # Format output for humans
         step_result = result["steps"][0]["result"]
         if step_result.get("error"):
-            typer.secho(f"Error: {step_result['error']}", fg=typer.colors.RED)
+            typer.secho(f"Error: {step_result['error']}", fg=typer.colors.RED, err=True)
             raise typer.Exit(1)
 
         typer.secho(f"Sent to {step_result['to']}", fg=typer.colors.GREEN)
         typer.echo(f"Subject: {step_result['subject']}")
 
-    except InvalidJobNameError as e:
-        typer.echo(f"Error: {e}", err=True)
-        raise typer.Exit(1)
-    except KeyError as e:
-        typer.echo(f"Error: {e}", err=True)
-        raise typer.Exit(1)
+    except typer.Exit:
+        raise
     except Exception as e:
+        # InvalidJobNameError, KeyError (unknown job) and step failures alike
         typer.echo(f"Error: {e}", err=True)
         raise typer.Exit(1)
 
@@ -204,6 +250,12 @@ def batch(
     recipients: str = typer.Argument(help="Path to JSON recipients file"),
     account: Optional[str] = typer.Option(None, "--account", "-a", help="authctl account name"),
     email_field: str = typer.Option("email", "--email-field", help="Field name for email address"),
+    max_workers: int = typer.Option(8, "--max-workers", min=1, help="Maximum concurrent sends"),
+    graph_batch: bool = typer.Option(
+        False,
+        "--graph-batch/--no-graph-batch",
+        help="Send up to 20 messages per Graph $batch request (msgraph only)",
+    ),
 ):
     """Send templated emails to multiple recipients.
 
@@ -212,8 +264,9 @@ def batch(
 
     Each recipient object's fields are available in the template.
     """
-    config = ctx.obj.get("config", {}) if ctx.obj else {}
-    dry_run = ctx.obj.get("dry_run", False) if ctx.obj else False
+    state = ctx_state(ctx)
+    config = state.config
+    dry_run = state.dry_run
 
     # Get account from option or config
     account = account or _get_default_account(config)
@@ -221,11 +274,13 @@ def batch(
         typer.secho(
             "Error: No account specified. Use --account or set email.account in config.",
             fg=typer.colors.RED,
+            err=True,
         )
         raise typer.Exit(1)
 
     # Resolve template path (e.g., "reminder" → ~/.life/templates/email/reminder.md)
-    template = _resolve_template_path(template, config)
+    template = _require_file(_resolve_template_path(template, config), "Template")
+    recipients = _require_file(recipients, "Recipients file")
 
     # Determine provider from config
     provider = _get_provider_for_account(account, config)
@@ -240,14 +295,16 @@ def batch(
         result = run_job(
             "email.batch_send",
             dry_run=False,
-            jobs_dir=_get_jobs_dir(),
+            jobs_dir=get_jobs_dir(),
             event_log=_get_event_log(config),
             variables={
                 "account": account,
                 "template": template,
                 "recipients_file": recipients,
-                "dry_run": str(dry_run).lower(),
+                "dry_run": dry_run,
                 "provider": provider,
+                "max_workers": max_workers,
+                "graph_batch": graph_batch,
             },
         )
 
@@ -255,9 +312,9 @@ def batch(
         step_result = result["steps"][0]["result"]
 
         if step_result.get("errors") and not step_result.get("dry_run"):
-            typer.secho("Errors occurred:", fg=typer.colors.RED)
+            typer.secho("Errors occurred:", fg=typer.colors.RED, err=True)
             for err in step_result["errors"]:
-                typer.echo(f"  - {err}")
+                typer.echo(f"  - {err}", err=True)
 
         if step_result.get("dry_run"):
             typer.secho(
@@ -270,13 +327,10 @@ def batch(
                 fg=typer.colors.GREEN if step_result["failed"] == 0 else typer.colors.YELLOW,
             )
 
-    except InvalidJobNameError as e:
-        typer.echo(f"Error: {e}", err=True)
-        raise typer.Exit(1)
-    except KeyError as e:
-        typer.echo(f"Error: {e}", err=True)
-        raise typer.Exit(1)
+    except typer.Exit:
+        raise
     except Exception as e:
+        # InvalidJobNameError, KeyError (unknown job) and step failures alike
         typer.echo(f"Error: {e}", err=True)
         raise typer.Exit(1)
 
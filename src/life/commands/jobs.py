@@ -7,22 +7,26 @@ Copyright 2025 Ben Mensi
 Licensed under the Apache License, Version 2.0
 """
 
-from pathlib import Path
+import sys
 
 import typer
-import yaml
 
-from life.job_runner import InvalidJobNameError, JobLoadError, get_job, list_jobs
+from life.commands._paths import get_jobs_dir
 
 app = typer.Typer(help="List and inspect job definitions")
 
 
-def _get_jobs_dir() -> Path:
-    """Get jobs directory from package location.
+def _dump_job(job_id: str, job: dict) -> str:
+    """Emit a job definition as YAML."""
+    import yaml
 
-    Jobs are always read from src/life/jobs/ (no user overrides).
-    """
-    return Path(__file__).parent.parent / "jobs"
+    # Prefer the libyaml-backed emitter; fall back to pure Python if unavailable
+    try:
+        from yaml import CSafeDumper as _Dumper
+    except ImportError:
+        from yaml import SafeDumper as _Dumper
+
+    return yaml.dump({job_id: job}, Dumper=_Dumper, default_flow_style=False, sort_keys=False)
 
 
 @app.command("list")
@@ -42,7 +46,9 @@ def list_command(
         life jobs list
         life jobs list --errors
     """
-    jobs_dir = _get_jobs_dir()
+    from life.job_runner import JobLoadError, list_jobs
+
+    jobs_dir = get_jobs_dir()
 
     if not jobs_dir.exists():
         typer.echo(f"Jobs directory not found: {jobs_dir}", err=True)
@@ -70,11 +76,12 @@ def list_command(
         typer.echo(f"Add job definitions to: {jobs_dir}")
         return
 
-    typer.echo("Available jobs:\n")
+    # Emit the whole listing in one write
+    lines = ["Available jobs:\n\n"]
     for job in jobs:
         desc = job["description"] or "(no description)"
-        typer.echo(f"  {job['job_id']}")
-        typer.echo(f"    {desc}\n")
+        lines.append(f"  {job['job_id']}\n    {desc}\n\n")
+    sys.stdout.write("".join(lines))
 
 
 @app.command("show")
@@ -90,7 +97,9 @@ def show_command(
         life jobs show sync_contacts
         life jobs show session_summary
     """
-    jobs_dir = _get_jobs_dir()
+    from life.job_runner import InvalidJobNameError, JobLoadError, get_job, get_job_source
+
+    jobs_dir = get_jobs_dir()
 
     if not jobs_dir.exists():
         typer.echo(f"Jobs directory not found: {jobs_dir}", err=True)
@@ -110,6 +119,6 @@ def show_command(
         typer.echo(f"Error: {e}", err=True)
         raise typer.Exit(1)
 
-    # Display job as YAML
+    # Display the job's YAML as written (comments included), else re-emit it
     typer.echo(f"Job: {job_id}\n")
-    typer.echo(yaml.dump({job_id: job}, default_flow_style=False, sort_keys=False))
+    typer.echo(get_job_source(job_id, jobs_dir) or _dump_job(job_id, job))
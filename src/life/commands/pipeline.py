@@ -7,44 +7,49 @@ Copyright 2025 Ben Mensi
 Licensed under the Apache License, Version 2.0
 """
 
+import sys
 from pathlib import Path
 
 import typer
 
-from life.job_runner import run_job
-from life_jobs.pipeline import clear_views_directory, get_vault_statistics
+from life.commands._ctx import ctx_state
+from life.commands._paths import expand_path, get_jobs_dir
 
 app = typer.Typer(help="Daily data pipeline operations")
 
 
-def _get_jobs_dir() -> Path:
-    """Get jobs directory from package location."""
-    return Path(__file__).parent.parent / "jobs"
-
-
 def _get_event_log(config: dict) -> Path:
     """Get event log path from config or default."""
     jobs_config = config.get("jobs", {})
     event_log = jobs_config.get("event_log", "~/.life/events.jsonl")
-    return Path(event_log).expanduser()
+    return expand_path(event_log)
 
 
 def _get_vault_path(config: dict) -> Path:
     """Get vault path from config, with ~ expansion."""
     pipeline_config = config.get("pipeline", {})
     vault_path = pipeline_config.get("vault_path", "~/clinical-vault")
-    return Path(vault_path).expanduser()
+    return expand_path(vault_path)
 
 
 def _print_result(result: dict) -> None:
-    """Pretty-print pipeline result."""
-    status = "✓ success" if result["success"] else "✗ failed"
-    typer.secho(f"=== Pipeline: {result['job_id']} ===", bold=True)
-    typer.secho(f"Status: {status}", fg="green" if result["success"] else "red")
-    typer.echo(f"Duration: {result['duration_ms'] / 1000:.1f}s")
+    """Pretty-print pipeline result in a single write (styled only on a tty)."""
+    success = result["success"]
+    error_message = result.get("error_message")
+    styled = sys.stdout.isatty()
+
+    header = f"=== Pipeline: {result['job_id']} ==="
+    status = f"Status: {'✓ success' if success else '✗ failed'}"
+    if styled:
+        header = typer.style(header, bold=True)
+        status = typer.style(status, fg="green" if success else "red")
+    lines = [header, status, f"Duration: {result['duration_ms'] / 1000:.1f}s"]
 
-    if not result["success"] and result.get("error_message"):
-        typer.secho(f"Error: {result['error_message']}", fg="red")
+    if not success and error_message:
+        error = f"Error: {error_message}"
+        lines.append(typer.style(error, fg="red") if styled else error)
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def _run_pipeline_job(
@@ -60,18 +65,21 @@ def _run_pipeline_job(
     Returns:
         The lorchestra result dict from run_lorchestra()
     """
-    config = ctx.obj.get("config", {}) if ctx.obj else {}
-    dry_run = ctx.obj.get("dry_run", False) if ctx.obj else False
-    verbose = ctx.obj.get("verbose", False) if ctx.obj else False
+    from life.job_runner import run_job
+
+    state = ctx_state(ctx)
+    config = state.config
+    dry_run = state.dry_run
+    verbose = state.verbose
 
     result = run_job(
         job_name,
         dry_run=False,  # Don't use job_runner's dry_run - pass to lorchestra instead
-        jobs_dir=_get_jobs_dir(),
+        jobs_dir=get_jobs_dir(),
         event_log=_get_event_log(config),
         variables={
-            "dry_run": str(dry_run).lower(),
-            "verbose": str(verbose).lower(),
+            "dry_run": dry_run,
+            "verbose": verbose,
         },
     )
 
@@ -119,8 +127,11 @@ def project(
     ),
 ):
     """Run local projection pipeline."""
-    config = ctx.obj.get("config", {}) if ctx.obj else {}
-    dry_run = ctx.obj.get("dry_run", False) if ctx.obj else False
+    from life_jobs.pipeline import clear_views_directory, get_vault_statistics
+
+    state = ctx_state(ctx)
+    config = state.config
+    dry_run = state.dry_run
     vault_path = _get_vault_path(config)
 
     # Clear views if full-refresh requested
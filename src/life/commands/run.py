@@ -8,35 +8,59 @@ Licensed under the Apache License, Version 2.0
 """
 
 import logging
+import sys
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 import typer
-from rich.console import Console
-from rich.table import Table
 
-from life.job_runner import (
-    CallNotAllowedError,
-    InvalidJobNameError,
-    JobLoadError,
-    UnsubstitutedVariableError,
-    run_job,
-)
+from life.commands._ctx import ctx_state
+from life.commands._paths import expand_path, get_jobs_dir
+
+if TYPE_CHECKING:
+    from rich.console import RenderableType
+    from rich.text import Text
 
 app = typer.Typer(help="Run a job by ID", invoke_without_command=True)
-console = Console()
 
+# Maximum record rows rendered in a result table
+MAX_DISPLAY_ROWS = 500
+
+# Column header cleanup for Dataverse field names
+_COLUMN_RENAMES = {"emailaddress1": "email"}
+_UNDERSCORE_TO_SPACE = str.maketrans("_", " ")
+
+# Suffix of OData annotation keys carrying display-formatted values
+_FORMATTED_SUFFIX = "@OData.Community.Display.V1.FormattedValue"
+
+# Record-table columns that are never shown: annotations, IDs, noisy dates
+_SKIP_SUFFIXES = (_FORMATTED_SUFFIX, "id")
+_NOISY_COLUMNS = frozenset({"createdon", "modifiedon"})
+_NAME_PART_COLUMNS = frozenset({"firstname", "lastname"})
+
+
+@lru_cache(maxsize=None)
+def _get_console():
+    """Get the shared rich Console (rich is imported on first use)."""
+    from rich.console import Console
+
+    return Console()
+
+
+def _format_result(result: Dict[str, Any]) -> Optional["RenderableType"]:
+    """Build a rich renderable for a step result (None if there is nothing to show)."""
+    from rich.console import Group
+    from rich.table import Table
 
-def _format_result(result: Dict[str, Any]) -> None:
-    """Format and display step result using rich."""
     # Handle query results with records
     if "records" in result and isinstance(result["records"], list):
         records = result["records"]
         count = result.get("count", len(records))
 
         if not records:
-            console.print("[dim]No records found[/dim]")
-            return
+            return "[dim]No records found[/dim]"
 
         # Preferred display columns (in order) - common useful fields
         preferred_cols = [
@@ -44,38 +68,34 @@ def _format_result(result: Dict[str, Any]) -> None:
             "name", "subject", "title", "description", "status",
         ]
 
+        # Columns with any non-null value, found in a single pass over records
+        if len(records) == 1:
+            non_null = {k for k, v in records[0].items() if v is not None}
+        else:
+            non_null = set()
+            for r in records:
+                non_null.update(k for k, v in r.items() if v is not None)
+
         # Build table from first record's keys (excluding OData metadata)
         display_keys = []
         first_record = records[0]
 
         # First add preferred columns that exist and have data
         for col in preferred_cols:
-            if col in first_record and col not in display_keys:
-                # Check if column has any non-null values
-                has_data = any(r.get(col) is not None for r in records)
-                if has_data:
-                    display_keys.append(col)
-
-        # Then add remaining columns (excluding metadata, IDs, and empty cols)
+            if col in first_record and col in non_null:
+                display_keys.append(col)
+
+        # Then add remaining columns (excluding metadata, IDs, and empty cols);
+        # firstname/lastname are redundant once fullname is shown
+        skip_cols = _NOISY_COLUMNS
+        if "fullname" in display_keys:
+            skip_cols = skip_cols | _NAME_PART_COLUMNS
         for key in first_record.keys():
-            if key in display_keys:
-                continue
-            if key.startswith("@odata"):
-                continue
-            if key.endswith("@OData.Community.Display.V1.FormattedValue"):
+            if key in skip_cols or key in display_keys:
                 continue
-            # Skip ID fields entirely for display
-            if key.endswith("id"):
+            if key.startswith("@odata") or key.endswith(_SKIP_SUFFIXES):
                 continue
-            # Skip firstname/lastname if we have fullname
-            if key in ("firstname", "lastname") and "fullname" in display_keys:
-                continue
-            # Skip dates (createdon, modifiedon) - too noisy
-            if key in ("createdon", "modifiedon"):
-                continue
-            # Check if column has any non-null values
-            has_data = any(r.get(key) is not None for r in records)
-            if has_data:
+            if key in non_null:
                 display_keys.append(key)
 
         table = Table(show_header=True, header_style="bold", show_lines=False)
@@ -83,61 +103,73 @@ def _format_result(result: Dict[str, Any]) -> None:
         # Add columns with clean names
         for key in display_keys:
             # Clean up column names for display
-            col_name = key.replace("emailaddress1", "email").replace("cre92_", "").replace("_", " ")
+            col_name = (
+                _COLUMN_RENAMES.get(key, key).replace("cre92_", "").translate(_UNDERSCORE_TO_SPACE)
+            )
             table.add_column(col_name, no_wrap=(key in ("fullname", "emailaddress1")))
 
-        for record in records:
-            row = []
-            for key in display_keys:
-                # Use formatted value if available, otherwise raw value
-                formatted_key = f"{key}@OData.Community.Display.V1.FormattedValue"
-                value = record.get(formatted_key, record.get(key))
-                if value is None:
-                    row.append("-")
-                else:
-                    row.append(str(value))
-            table.add_row(*row)
-
-        console.print(f"\n[bold green]{count}[/bold green] records:")
-        console.print(table)
+        # Use formatted value if available, otherwise raw value
+        formatted_keys = [(key, key + _FORMATTED_SUFFIX) for key in display_keys]
+        for record in islice(records, MAX_DISPLAY_ROWS):
+            values = (record.get(fkey, record.get(key)) for key, fkey in formatted_keys)
+            table.add_row(*("-" if value is None else str(value) for value in values))
+
+        # Rendering huge tables is wasted work; the full result is in --output
+        hidden = len(records) - MAX_DISPLAY_ROWS
+        if hidden > 0:
+            table.add_row(f"[dim]... {hidden} more[/dim]", *[""] * (len(display_keys) - 1))
 
+        parts = [f"\n[bold green]{count}[/bold green] records:", table]
         if result.get("output"):
-            console.print(f"\n[dim]Written to: {result['output']}[/dim]")
+            parts.append(f"\n[dim]Written to: {result['output']}[/dim]")
+        return Group(*parts)
 
     # Handle single record results
     elif isinstance(result, dict) and not any(k in result for k in ["records", "count"]):
         # Filter out OData metadata for display
-        display_items = {k: v for k, v in result.items()
-                        if not k.startswith("@odata") and
-                        not k.endswith("@OData.Community.Display.V1.FormattedValue")}
+        display_items = {
+            k: v for k, v in result.items()
+            if not (k.startswith("@odata") or k.endswith(_FORMATTED_SUFFIX))
+        }
         if display_items:
             table = Table(show_header=False)
             table.add_column("Field", style="bold")
             table.add_column("Value")
             for key, value in display_items.items():
                 table.add_row(key, str(value) if value is not None else "-")
-            console.print(table)
+            return table
+        return None
 
     # Fallback to simple key-value display
-    else:
-        for key, value in result.items():
-            if key != "records":
-                console.print(f"  [bold]{key}:[/bold] {value}")
+    return Group(
+        *(f"  [bold]{key}:[/bold] {value}" for key, value in result.items() if key != "records")
+    )
 
 
-def _get_jobs_dir() -> Path:
-    """Get jobs directory from package location.
+def _write_lines(lines: List[str]) -> None:
+    """Write buffered output lines in a single call."""
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
 
-    Jobs are always read from src/life/jobs/ (no user overrides).
-    """
-    return Path(__file__).parent.parent / "jobs"
+
+def _plain_text(lines: List[str]) -> "Text":
+    """Wrap buffered output lines as unstyled, unwrapped rich Text."""
+    from rich.text import Text
+
+    return Text("\n".join(lines), no_wrap=True, overflow="ignore")
+
+
+@lru_cache(maxsize=None)
+def _dir_exists(path: Path) -> bool:
+    """Check that a directory exists (stat'd once per process)."""
+    return path.is_dir()
 
 
 def _get_event_log(config: dict) -> Path:
     """Get event log path from config or default."""
     jobs_config = config.get("jobs", {})
     event_log = jobs_config.get("event_log", "~/.life/events.jsonl")
-    return Path(event_log).expanduser()
+    return expand_path(event_log)
 
 
 @app.callback(invoke_without_command=True)
@@ -166,28 +198,37 @@ def run_command(
         typer.echo(ctx.get_help())
         raise typer.Exit(0)
 
+    from life.job_runner import (
+        CallNotAllowedError,
+        InvalidJobNameError,
+        JobLoadError,
+        UnsubstitutedVariableError,
+        run_job,
+    )
+
     logger = logging.getLogger(__name__)
 
     # Get config and options from parent context
-    config = ctx.obj.get("config", {}) if ctx.obj else {}
-    dry_run = ctx.obj.get("dry_run", False) if ctx.obj else False
-    verbose = ctx.obj.get("verbose", False) if ctx.obj else False
+    state = ctx_state(ctx)
+    config = state.config
+    dry_run = state.dry_run
+    verbose = state.verbose
 
-    jobs_dir = _get_jobs_dir()
+    jobs_dir = get_jobs_dir()
     event_log = _get_event_log(config)
 
     # Parse variables from --var options
     variables = {}
     if var:
         for v in var:
-            if "=" not in v:
+            key, sep, value = v.partition("=")
+            if not sep:
                 typer.echo(f"Error: Invalid variable format '{v}'. Use KEY=VALUE", err=True)
                 raise typer.Exit(1)
-            key, value = v.split("=", 1)
             variables[key] = value
 
     # Check jobs directory exists (should always exist in package)
-    if not jobs_dir.exists():
+    if not _dir_exists(jobs_dir):
         typer.echo(f"Error: Jobs directory not found: {jobs_dir}", err=True)
         typer.echo("This is a package installation issue.", err=True)
         raise typer.Exit(1)
@@ -205,11 +246,15 @@ def run_command(
             variables=variables if variables else None,
         )
 
-        # Display results
-        typer.echo(f"Job: {job_id}")
-        typer.echo(f"Run ID: {result['run_id']}")
-        typer.echo(f"Status: {result['status']}")
-        typer.echo("")
+        # Display results; plain lines are written in one call, or rendered with
+        # any step results as a single rich Group
+        renderables = []
+        lines = [
+            f"Job: {job_id}",
+            f"Run ID: {result['run_id']}",
+            f"Status: {result['status']}",
+            "",
+        ]
 
         for i, step in enumerate(result["steps"], 1):
             if step["status"] == "success":
@@ -218,18 +263,30 @@ def run_command(
                 status_icon = "○"
             else:
                 status_icon = "✗"
-            typer.echo(f"  {status_icon} Step {i}: {step['step']}")
+            lines.append(f"  {status_icon} Step {i}: {step['step']}")
             if verbose:
-                typer.echo(f"    call: {step['call']}")
+                lines.append(f"    call: {step['call']}")
                 if step.get("args"):
-                    typer.echo(f"    args: {step['args']}")
+                    lines.append(f"    args: {step['args']}")
 
             # Always display step results if present
             if step.get("result") and not step.get("dry_run"):
-                _format_result(step["result"])
+                rendered = _format_result(step["result"])
+                if rendered is not None:
+                    renderables += [_plain_text(lines), rendered]
+                    lines = []
 
         if dry_run:
-            typer.echo("\n[DRY RUN] No changes made")
+            lines.append("\n[DRY RUN] No changes made")
+
+        if renderables:
+            from rich.console import Group
+
+            if lines:
+                renderables.append(_plain_text(lines))
+            _get_console().print(Group(*renderables))
+        else:
+            _write_lines(lines)
 
     except JobLoadError as e:
         typer.echo("Error loading job files:", err=True)
@@ -13,21 +13,17 @@ from typing import Optional
 
 import typer
 
-from life.job_runner import InvalidJobNameError, run_job
+from life.commands._ctx import ctx_state
+from life.commands._paths import expand_path, get_jobs_dir
 
 app = typer.Typer(help="Daily note creation and reflection")
 
 
-def _get_jobs_dir() -> Path:
-    """Get jobs directory from package location."""
-    return Path(__file__).parent.parent / "jobs"
-
-
 def _get_event_log(config: dict) -> Path:
     """Get event log path from config or default."""
     jobs_config = config.get("jobs", {})
     event_log = jobs_config.get("event_log", "~/.life/events.jsonl")
-    return Path(event_log).expanduser()
+    return expand_path(event_log)
 
 
 def _get_daily_dir(config: dict) -> str:
@@ -35,11 +31,11 @@ def _get_daily_dir(config: dict) -> str:
     today_config = config.get("today", {})
 
     if "daily_dir" in today_config:
-        return str(Path(today_config["daily_dir"]).expanduser())
+        return str(expand_path(today_config["daily_dir"]))
 
     workspace = config.get("workspace")
     if workspace:
-        base = Path(workspace).expanduser()
+        base = expand_path(workspace)
     else:
         base = Path.cwd()
 
@@ -51,11 +47,11 @@ def _get_template_path(config: dict) -> str:
     today_config = config.get("today", {})
 
     if "template_path" in today_config:
-        return str(Path(today_config["template_path"]).expanduser())
+        return str(expand_path(today_config["template_path"]))
 
     workspace = config.get("workspace")
     if workspace:
-        base = Path(workspace).expanduser()
+        base = expand_path(workspace)
     else:
         base = Path.cwd()
 
@@ -74,8 +70,11 @@ def create_cmd(
     Creates a daily operational note from the template. Fails gracefully
     if the note already exists.
     """
-    config = ctx.obj.get("config", {}) if ctx.obj else {}
-    dry_run = ctx.obj.get("dry_run", False) if ctx.obj else False
+    from life.job_runner import InvalidJobNameError, run_job
+
+    state = ctx_state(ctx)
+    config = state.config
+    dry_run = state.dry_run
 
     # Determine date
     date_str = date if date else datetime.now().strftime("%Y-%m-%d")
@@ -94,7 +93,7 @@ def create_cmd(
         result = run_job(
             "today.create_note",
             dry_run=False,
-            jobs_dir=_get_jobs_dir(),
+            jobs_dir=get_jobs_dir(),
             event_log=_get_event_log(config),
             variables={
                 "date": date_str,
@@ -142,8 +141,11 @@ def prompt(
     Uses the llm Python library. Appends Q&A section to today's note.
     Use --context N to include previous N days for additional context.
     """
-    config = ctx.obj.get("config", {}) if ctx.obj else {}
-    dry_run = ctx.obj.get("dry_run", False) if ctx.obj else False
+    from life.job_runner import InvalidJobNameError, run_job
+
+    state = ctx_state(ctx)
+    config = state.config
+    dry_run = state.dry_run
 
     # Get today's note path
     date_str = datetime.now().strftime("%Y-%m-%d")
@@ -170,7 +172,7 @@ def prompt(
         result = run_job(
             "today.prompt_llm",
             dry_run=False,
-            jobs_dir=_get_jobs_dir(),
+            jobs_dir=get_jobs_dir(),
             event_log=_get_event_log(config),
             variables={
                 "note_path": note_path,
@@ -7,19 +7,103 @@ Copyright 2025 Ben Mensi
 Licensed under the Apache License, Version 2.0
 """
 
+import hashlib
 import logging
+import os
+import pickle
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import yaml
 
+from life.validation import validate_config
+
+# Prefer the libyaml-backed loader; fall back to pure Python if unavailable
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
 logger = logging.getLogger(__name__)
 
 
+class ConfigParseError(yaml.YAMLError):
+    """Raised when the config file is not valid YAML."""
+
+    pass
+
+
+# Parsed configs and their validation issues are cached here, keyed by
+# (format version, path, mtime_ns, size)
+DEFAULT_CACHE_DIR = "~/.cache/life"
+_CACHE_VERSION = 2
+
+
+def get_cache_dir() -> Path:
+    """Get parse cache directory ($LIFE_CACHE_DIR overrides the default)."""
+    return Path(os.environ.get("LIFE_CACHE_DIR", DEFAULT_CACHE_DIR)).expanduser()
+
+
+def _cache_file(path: Path) -> Path:
+    digest = hashlib.sha1(str(path).encode()).hexdigest()[:16]
+    return get_cache_dir() / f"config-{digest}.pkl"
+
+
+def _read_cached(path: Path, key: Tuple) -> Optional[Any]:
+    """Return the cached parse for key, or None on miss/stale/corrupt cache."""
+    try:
+        with open(_cache_file(path), "rb") as f:
+            cached_key, data = pickle.load(f)
+    except Exception:
+        return None
+    return data if cached_key == key else None
+
+
+def _write_cached(path: Path, key: Tuple, data: Any) -> None:
+    """Atomically write the parse cache; failures are ignored."""
+    cache_file = _cache_file(path)
+    tmp = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp, "wb") as f:
+            pickle.dump((key, data), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, cache_file)
+    except OSError as e:
+        logger.debug(f"Could not write config cache {cache_file}: {e}")
+        tmp.unlink(missing_ok=True)
+
+
+# (config, issues) from the most recent load_config, so later validation of
+# that same config object can reuse the issues instead of re-walking it
+_last_loaded: Optional[Tuple[Dict[str, Any], List[str]]] = None
+
+
+def get_config_issues(config: Dict[str, Any]) -> List[str]:
+    """
+    Get validation issues for a config.
+
+    Reuses the issues found by load_config when given the config it returned
+    (configs are not modified after loading); other configs are validated.
+
+    Args:
+        config: Configuration dictionary
+
+    Returns:
+        List of warning/error messages (empty if valid)
+    """
+    if _last_loaded is not None and _last_loaded[0] is config:
+        return list(_last_loaded[1])
+    return validate_config(config)
+
+
 def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
     """
     Load configuration from YAML file.
 
+    The parsed YAML and its validation issues are cached on disk (see
+    get_cache_dir) keyed by the file's path, mtime and size, so unchanged
+    configs skip parsing and validation entirely.
+
     Args:
         config_path: Path to config file. If None, uses ~/.life/config.yml
 
@@ -28,7 +112,7 @@ def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
 
     Raises:
         FileNotFoundError: If config file not found
-        yaml.YAMLError: If config file is invalid YAML
+        ConfigParseError: If config file is invalid YAML (a yaml.YAMLError)
     """
     # Determine config file path
     if config_path:
@@ -43,23 +127,35 @@ def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
                 "Create ~/.life/config.yml or use --config to specify a custom location."
             )
 
-    # Load YAML
-    try:
-        with open(path, "r") as f:
-            config = yaml.safe_load(f)
-    except yaml.YAMLError as e:
-        raise yaml.YAMLError(f"Error parsing config file {path}: {e}")
-
-    if config is None:
-        config = {}
+    # Reuse the previous parse and validation if the file is unchanged
+    # (stat raises if missing)
+    st = path.stat()
+    key = (_CACHE_VERSION, str(path), st.st_mtime_ns, st.st_size)
+    cached = _read_cached(path, key)
+
+    if cached is None:
+        # Load YAML
+        try:
+            # Bytes go straight to the loader, which detects the encoding itself
+            with open(path, "rb") as f:
+                config = yaml.load(f, Loader=_Loader)
+        except yaml.YAMLError as e:
+            raise ConfigParseError(f"Error parsing config file {path}: {e}")
+        if config is None:
+            config = {}
+        issues = validate_config(config)
+        _write_cached(path, key, (config, issues))
+    else:
+        config, issues = cached
 
     # Expand workspace path if present
     if "workspace" in config:
         config["workspace"] = str(Path(config["workspace"]).expanduser())
 
-    # Validate configuration
-    from life.validation import validate_config
-    issues = validate_config(config)
+    global _last_loaded
+    _last_loaded = (config, issues)
+
+    # Report validation issues (computed on the raw parse, cached alongside it)
     if issues:
         logger.warning("Configuration validation warnings:")
         for issue in issues:
@@ -7,35 +7,44 @@ Config manager for Life-CLI.
 Provides semantic validation and analysis of Life-CLI configuration.
 """
 
-from typing import Any, Dict, List, Set, Tuple
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 
-from life.registry import get_tool_info, is_tool_installed
-from life.validation import validate_config
+from life.config import get_config_issues
+from life.registry import TOOL_REGISTRY, ToolInfo, is_binary_on_path
 
+# Task categories whose entries run shell commands, in display order
+TASK_CATEGORIES = ("sync", "merge", "process", "status")
 
-def extract_tools_from_command(command: str) -> List[str]:
+# Wrappers that precede the actual command (sudo, env, etc.)
+SHELL_PREFIXES = frozenset({"sudo", "env", "time", "nice", "nohup"})
+
+
+@lru_cache(maxsize=4096)
+def extract_tools_from_command(command: str) -> Tuple[str, ...]:
     """
     Extract tool names from a command string.
 
+    Results are memoized, since the same command often appears in many tasks.
+
     Args:
         command: Command string (may contain variables)
 
     Returns:
-        List of tool names found in the command
+        Tuple of tool names found in the command
     """
     # Split command and get the first token (the actual command)
     # Handle shell redirects, pipes, etc.
     parts = command.strip().split()
     if not parts:
-        return []
+        return ()
 
     # Get first command (before any pipes, redirects, etc.)
     first_cmd = parts[0]
 
     # Remove shell prefixes (sudo, env, etc.)
-    shell_prefixes = {"sudo", "env", "time", "nice", "nohup"}
     idx = 0
-    while idx < len(parts) and parts[idx] in shell_prefixes:
+    while idx < len(parts) and parts[idx] in SHELL_PREFIXES:
         idx += 1
 
     # Skip environment variable assignments (VAR=value)
@@ -46,12 +55,41 @@ def extract_tools_from_command(command: str) -> List[str]:
     if idx < len(parts):
         first_cmd = parts[idx]
     else:
-        return []
+        return ()
 
     # Extract just the binary name (strip path)
     tool_name = first_cmd.split("/")[-1]
 
-    return [tool_name] if tool_name else []
+    return (tool_name,) if tool_name else ()
+
+
+def _iter_tasks(config: Dict[str, Any]) -> Iterator[Tuple[str, str, Dict[str, Any]]]:
+    """Yield (category, task name, task config) for every command task.
+
+    Merge tasks are nested one level deeper and are named "<group>.<task>".
+    """
+    for category in TASK_CATEGORIES:
+        if category == "merge":
+            for group, tasks in config.get("merge", {}).items():
+                for task_name, task_config in tasks.items():
+                    yield category, f"{group}.{task_name}", task_config
+        else:
+            for task_name, task_config in config.get(category, {}).items():
+                yield category, task_name, task_config
+
+
+def _iter_commands(task_config: Dict[str, Any]) -> Iterator[str]:
+    """Yield a task's single command and/or each entry of its command list."""
+    if "command" in task_config:
+        yield task_config["command"]
+    yield from task_config.get("commands", ())
+
+
+def _collect_task_tools(task_config: Dict[str, Any]) -> Set[str]:
+    """Collect tools from all of a task's commands."""
+    return {
+        tool for cmd in _iter_commands(task_config) for tool in extract_tools_from_command(cmd)
+    }
 
 
 def extract_tools_from_config(config: Dict[str, Any]) -> Set[str]:
@@ -65,44 +103,20 @@ def extract_tools_from_config(config: Dict[str, Any]) -> Set[str]:
         Set of unique tool names referenced in commands
     """
     tools = set()
+    for _, _, task_config in _iter_tasks(config):
+        tools.update(_collect_task_tools(task_config))
+    return tools
 
-    # Check sync tasks
-    for task_name, task_config in config.get("sync", {}).items():
-        # Single command
-        if "command" in task_config:
-            tools.update(extract_tools_from_command(task_config["command"]))
-
-        # Multiple commands
-        if "commands" in task_config:
-            for cmd in task_config["commands"]:
-                tools.update(extract_tools_from_command(cmd))
-
-    # Check merge tasks (nested structure)
-    for category, tasks in config.get("merge", {}).items():
-        for task_name, task_config in tasks.items():
-            if "command" in task_config:
-                tools.update(extract_tools_from_command(task_config["command"]))
-            if "commands" in task_config:
-                for cmd in task_config["commands"]:
-                    tools.update(extract_tools_from_command(cmd))
-
-    # Check process tasks
-    for task_name, task_config in config.get("process", {}).items():
-        if "command" in task_config:
-            tools.update(extract_tools_from_command(task_config["command"]))
-        if "commands" in task_config:
-            for cmd in task_config["commands"]:
-                tools.update(extract_tools_from_command(cmd))
-
-    # Check status tasks
-    for task_name, task_config in config.get("status", {}).items():
-        if "command" in task_config:
-            tools.update(extract_tools_from_command(task_config["command"]))
-        if "commands" in task_config:
-            for cmd in task_config["commands"]:
-                tools.update(extract_tools_from_command(cmd))
 
-    return tools
+def _tool_status(tool: str, tool_info: Optional[ToolInfo]) -> Tuple[bool, str]:
+    """Check a tool on PATH and build its status message from one registry lookup."""
+    if tool_info:
+        if is_binary_on_path(tool_info.binary):
+            return True, f"✓ {tool_info.description}"
+        return False, f"✗ Not installed. {tool_info.install_hint}"
+    if is_binary_on_path(tool):
+        return True, "✓ Tool found on PATH"
+    return False, "✗ Not found on PATH (unknown tool)"
 
 
 def validate_tools(config: Dict[str, Any]) -> List[Tuple[str, bool, str]]:
@@ -119,20 +133,7 @@ def validate_tools(config: Dict[str, Any]) -> List[Tuple[str, bool, str]]:
     results = []
 
     for tool in sorted(tools):
-        installed = is_tool_installed(tool)
-        tool_info = get_tool_info(tool)
-
-        if installed:
-            if tool_info:
-                message = f"✓ {tool_info.description}"
-            else:
-                message = "✓ Tool found on PATH"
-        else:
-            if tool_info:
-                message = f"✗ Not installed. {tool_info.install_hint}"
-            else:
-                message = "✗ Not found on PATH (unknown tool)"
-
+        installed, message = _tool_status(tool, TOOL_REGISTRY.get(tool))
         results.append((tool, installed, message))
 
     return results
@@ -148,83 +149,15 @@ def get_task_summary(config: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
     Returns:
         Dictionary mapping command types to lists of task info
     """
-    summary = {
-        "sync": [],
-        "merge": [],
-        "process": [],
-        "status": [],
-    }
-
-    # Sync tasks
-    for task_name, task_config in config.get("sync", {}).items():
-        tools = set()
-        if "command" in task_config:
-            tools.update(extract_tools_from_command(task_config["command"]))
-        if "commands" in task_config:
-            for cmd in task_config["commands"]:
-                tools.update(extract_tools_from_command(cmd))
-
-        summary["sync"].append(
-            {
-                "name": task_name,
-                "description": task_config.get("description", "No description"),
-                "tools": sorted(tools),
-                "incremental": "incremental_field" in task_config,
-            }
-        )
-
-    # Merge tasks (nested structure)
-    for category, tasks in config.get("merge", {}).items():
-        for task_name, task_config in tasks.items():
-            tools = set()
-            if "command" in task_config:
-                tools.update(extract_tools_from_command(task_config["command"]))
-            if "commands" in task_config:
-                for cmd in task_config["commands"]:
-                    tools.update(extract_tools_from_command(cmd))
-
-            summary["merge"].append(
-                {
-                    "name": f"{category}.{task_name}",
-                    "description": task_config.get("description", "No description"),
-                    "tools": sorted(tools),
-                    "incremental": False,
-                }
-            )
-
-    # Process tasks
-    for task_name, task_config in config.get("process", {}).items():
-        tools = set()
-        if "command" in task_config:
-            tools.update(extract_tools_from_command(task_config["command"]))
-        if "commands" in task_config:
-            for cmd in task_config["commands"]:
-                tools.update(extract_tools_from_command(cmd))
-
-        summary["process"].append(
-            {
-                "name": task_name,
-                "description": task_config.get("description", "No description"),
-                "tools": sorted(tools),
-                "incremental": False,
-            }
-        )
-
-    # Status tasks
-    for task_name, task_config in config.get("status", {}).items():
-        tools = set()
-        if "command" in task_config:
-            tools.update(extract_tools_from_command(task_config["command"]))
-        if "commands" in task_config:
-            for cmd in task_config["commands"]:
-                tools.update(extract_tools_from_command(cmd))
+    summary = {category: [] for category in TASK_CATEGORIES}
 
-        summary["status"].append(
+    for category, task_name, task_config in _iter_tasks(config):
+        summary[category].append(
             {
                 "name": task_name,
                 "description": task_config.get("description", "No description"),
-                "tools": sorted(tools),
-                "incremental": False,
+                "tools": sorted(_collect_task_tools(task_config)),
+                "incremental": category == "sync" and "incremental_field" in task_config,
             }
         )
 
@@ -241,8 +174,8 @@ def full_validation(config: Dict[str, Any]) -> Tuple[List[str], List[Tuple[str,
     Returns:
         Tuple of (structure_issues, tool_results)
     """
-    # Validate structure
-    structure_issues = validate_config(config)
+    # Validate structure (reusing load_config's result for a loaded config)
+    structure_issues = get_config_issues(config)
 
     # Validate tools
     tool_results = validate_tools(config)
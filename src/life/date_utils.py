@@ -8,9 +8,16 @@ Provides date range helpers for task configuration.
 """
 
 import re
-from datetime import datetime, timedelta
+from datetime import date, timedelta
+from functools import lru_cache
 from typing import Tuple
 
+# Number + unit, e.g. "7d", "2w", "1m" (matched case-insensitively)
+_RANGE_RE = re.compile(r"(\d+)([dwm])")
+
+# Days per unit (a month is approximated as 30 days)
+_UNIT_DAYS = {"d": 1, "w": 7, "m": 30}
+
 
 def parse_date_range(date_range_str: str) -> Tuple[str, str]:
     """
@@ -32,32 +39,24 @@ def parse_date_range(date_range_str: str) -> Tuple[str, str]:
         >>> parse_date_range("7d")
         ('2024-11-03', '2024-11-10')
     """
+    return _date_range_for(date_range_str, date.today())
+
+
+@lru_cache(maxsize=16)
+def _date_range_for(date_range_str: str, today: date) -> Tuple[str, str]:
+    """Compute the range ending on today (memoized; today is part of the key)."""
     # Parse the date range string
-    match = re.match(r'(\d+)([dwm])', date_range_str.lower())
+    match = _RANGE_RE.match(date_range_str.lower())
     if not match:
         raise ValueError(
             f"Invalid date_range format: '{date_range_str}'. "
             "Expected format: number + unit (e.g., '7d', '1w', '30d')"
         )
 
-    amount = int(match.group(1))
-    unit = match.group(2)
-
-    # Convert to days
-    if unit == 'd':
-        days = amount
-    elif unit == 'w':
-        days = amount * 7
-    elif unit == 'm':
-        days = amount * 30
-    else:
-        raise ValueError(f"Unknown unit: {unit}. Use 'd' (days), 'w' (weeks), or 'm' (months)")
-
-    # Calculate dates
-    to_date = datetime.now().date()
-    from_date = to_date - timedelta(days=days)
+    days = int(match.group(1)) * _UNIT_DAYS[match.group(2)]
+    from_date = today - timedelta(days=days)
 
-    return from_date.isoformat(), to_date.isoformat()
+    return from_date.isoformat(), today.isoformat()
 
 
 def get_date_variables(date_range: str) -> dict:
@@ -12,7 +12,26 @@ Licensed under the Apache License, Version 2.0
 import json
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
+
+# Prefer orjson for serialization (it encodes datetimes natively); fall back to
+# the stdlib encoder if unavailable. Both return one newline-terminated line.
+try:
+    import orjson
+
+    def _dumps(event: dict) -> bytes:
+        return orjson.dumps(event, option=orjson.OPT_APPEND_NEWLINE)
+
+except ImportError:
+
+    def _json_default(obj):
+        if isinstance(obj, datetime):
+            return obj.isoformat()
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+    def _dumps(event: dict) -> bytes:
+        line = json.dumps(event, ensure_ascii=False, separators=(",", ":"), default=_json_default)
+        return (line + "\n").encode()
 
 # Fixed set of allowed event types (Rule 7)
 ALLOWED_EVENT_TYPES = frozenset({
@@ -29,11 +48,43 @@ ALLOWED_EVENT_TYPES = frozenset({
 
 
 class EventClient:
-    """Append-only JSONL event log."""
+    """Append-only JSONL event log.
+
+    Use as a context manager to keep the log open across many events;
+    otherwise each event opens and closes the file. Between begin_batch() and
+    flush_batch() (or close), events are held in memory and written together.
+    """
 
     def __init__(self, log_path: Path):
         self.log_path = log_path
         self.log_path.parent.mkdir(parents=True, exist_ok=True)
+        self._fh = None
+        self._pending: Optional[List[bytes]] = None
+
+    def __enter__(self) -> "EventClient":
+        # Unbuffered, so each event reaches the file in a single write
+        self._fh = self.log_path.open("ab", buffering=0)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def begin_batch(self) -> None:
+        """Hold subsequent events in memory until flush_batch()."""
+        if self._pending is None:
+            self._pending = []
+
+    def flush_batch(self) -> None:
+        """Write held events in one write and stop batching."""
+        pending, self._pending = self._pending, None
+        if pending:
+            self._write(b"".join(pending))
+
+    def close(self) -> None:
+        self.flush_batch()
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
 
     def log_event(
         self,
@@ -49,7 +100,7 @@ class EventClient:
             )
 
         event = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": datetime.now(timezone.utc),
             "event_type": event_type,
             "correlation_id": correlation_id,
             "status": status,
@@ -58,5 +109,15 @@ class EventClient:
         if error_message:
             event["error_message"] = error_message
 
-        with self.log_path.open("a") as f:
-            f.write(json.dumps(event) + "\n")
+        line = _dumps(event)
+        if self._pending is not None:
+            self._pending.append(line)
+        else:
+            self._write(line)
+
+    def _write(self, data: bytes) -> None:
+        if self._fh is not None:
+            self._fh.write(data)
+        else:
+            with self.log_path.open("ab") as f:
+                f.write(data)
@@ -10,23 +10,48 @@ Copyright 2025 Ben Mensi
 Licensed under the Apache License, Version 2.0
 """
 
+import hashlib
 import importlib
+import json
+import logging
+import os
 import re
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from types import ModuleType
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 import yaml
 
+from life.config import get_cache_dir
 from life.event_client import EventClient
 
+# Prefer the libyaml-backed loader; fall back to pure Python if unavailable
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
+# Prefer orjson for reading the jobs cache; fall back to the stdlib decoder
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+logger = logging.getLogger(__name__)
+
 # Allowlist for call: resolution (Rule 3)
 ALLOWED_CALL_PREFIXES = ("life_jobs.",)
 
 # Job name must be dotted namespace: <domain>.<action>
 JOB_NAME_PATTERN = re.compile(r"^\w+\.\w+$")
 
+# Top-level "jobs:" key in a job file (get_job_source)
+_JOBS_HEADER_RE = re.compile(r"^jobs:\s*(#.*)?$")
+
 
 class JobLoadError(Exception):
     """Raised when job YAML files fail to load."""
@@ -74,18 +99,47 @@ def resolve_callable(call_path: str) -> Callable:
 
     Only allows imports from ALLOWED_CALL_PREFIXES (Rule 3).
     """
-    if not any(call_path.startswith(prefix) for prefix in ALLOWED_CALL_PREFIXES):
+    module, func_name = _resolve_module(call_path)
+    return getattr(module, func_name)
+
+
+@lru_cache(maxsize=256)
+def _resolve_module(call_path: str) -> Tuple[ModuleType, str]:
+    """Check and import a call path's module once per process.
+
+    The function itself is looked up on every resolve, so patched or reloaded
+    module attributes are still picked up.
+    """
+    if not call_path.startswith(ALLOWED_CALL_PREFIXES):
         raise CallNotAllowedError(
             f"call: '{call_path}' not allowed. Must start with one of: {ALLOWED_CALL_PREFIXES}"
         )
     module_path, func_name = call_path.rsplit(".", 1)
-    module = importlib.import_module(module_path)
-    return getattr(module, func_name)
+    return importlib.import_module(module_path), func_name
+
+
+# Below this many job files, a thread pool costs more than it saves
+_PARALLEL_LOAD_MIN_FILES = 4
+_LOAD_WORKERS = 8
+
+
+def _parse_job_file(yaml_file: Path) -> Tuple[Dict[str, Dict], Optional[str]]:
+    """Parse one job file, returning (jobs, error message or None)."""
+    try:
+        # Bytes go straight to the loader, which detects the encoding itself
+        with open(yaml_file, "rb") as f:
+            data = yaml.load(f, Loader=_Loader) or {}
+    except yaml.YAMLError as e:
+        return {}, str(e)
+    return data.get("jobs", {}), None
 
 
 def load_jobs(jobs_dir: Path) -> Dict[str, Dict]:
     """Load all jobs from YAML files in jobs_dir.
 
+    Files are read and parsed concurrently when there are enough of them;
+    results are merged in sorted filename order either way.
+
     Raises JobLoadError if any YAML file fails to parse (Rule 1).
     """
     all_jobs: Dict[str, Dict] = {}
@@ -94,13 +148,19 @@ def load_jobs(jobs_dir: Path) -> Dict[str, Dict]:
     if not jobs_dir.exists():
         return all_jobs
 
-    for yaml_file in sorted(jobs_dir.glob("*.yaml")):
-        try:
-            data = yaml.safe_load(yaml_file.read_text()) or {}
-            jobs = data.get("jobs", {})
+    yaml_files = sorted(jobs_dir.glob("*.yaml"))
+    if len(yaml_files) < _PARALLEL_LOAD_MIN_FILES:
+        parsed = map(_parse_job_file, yaml_files)
+    else:
+        workers = min(_LOAD_WORKERS, os.cpu_count() or 1, len(yaml_files))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            parsed = list(pool.map(_parse_job_file, yaml_files))
+
+    for yaml_file, (jobs, error) in zip(yaml_files, parsed):
+        if error is not None:
+            errors.append((yaml_file, error))
+        else:
             all_jobs.update(jobs)
-        except yaml.YAMLError as e:
-            errors.append((yaml_file, str(e)))
 
     if errors:
         raise JobLoadError(errors)
@@ -108,6 +168,67 @@ def load_jobs(jobs_dir: Path) -> Dict[str, Dict]:
     return all_jobs
 
 
+# In-process cache: jobs_dir -> (file signature, jobs)
+_JOBS_CACHE: Dict[Path, Tuple[List[list], Dict[str, Dict]]] = {}
+
+
+def _jobs_cache_file(jobs_dir: Path) -> Path:
+    digest = hashlib.sha1(str(jobs_dir.resolve()).encode()).hexdigest()[:16]
+    return get_cache_dir() / f"jobs-{digest}.json"
+
+
+def load_jobs_cached(jobs_dir: Path) -> Dict[str, Dict]:
+    """Load all jobs, reusing cached parses while the YAML files are unchanged.
+
+    Results are kept in memory for the life of the process and in a JSON
+    file across processes. Both are keyed on the (name, mtime_ns, size) of
+    every *.yaml file, so edits, additions and removals all trigger a fresh
+    load_jobs(). Parse errors are never cached.
+    """
+    if not jobs_dir.exists():
+        return {}
+
+    key = []
+    for yaml_file in sorted(jobs_dir.glob("*.yaml")):
+        st = yaml_file.stat()
+        key.append([yaml_file.name, st.st_mtime_ns, st.st_size])
+
+    cached = _JOBS_CACHE.get(jobs_dir)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    cache_file = _jobs_cache_file(jobs_dir)
+    try:
+        cached = _json_loads(cache_file.read_bytes())
+        if cached["key"] == key:
+            _JOBS_CACHE[jobs_dir] = (key, cached["jobs"])
+            return cached["jobs"]
+    except Exception:
+        pass
+
+    jobs = load_jobs(jobs_dir)
+    _JOBS_CACHE[jobs_dir] = (key, jobs)
+
+    # Only cache jobs that survive a JSON round trip unchanged
+    try:
+        payload = json.dumps({"key": key, "jobs": jobs}, separators=(",", ":"))
+        if _json_loads(payload)["jobs"] != jobs:
+            return jobs
+    except (TypeError, ValueError):
+        return jobs
+
+    tmp = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_text(payload)
+        os.replace(tmp, cache_file)
+    except OSError as e:
+        logger.debug(f"Could not write jobs cache {cache_file}: {e}")
+        tmp.unlink(missing_ok=True)
+
+    return jobs
+
+
 def get_job(job_id: str, jobs_dir: Path) -> Dict:
     """Get a single job definition by ID.
 
@@ -115,15 +236,72 @@ def get_job(job_id: str, jobs_dir: Path) -> Dict:
     Raises KeyError if job not found.
     """
     validate_job_name(job_id)
-    jobs = load_jobs(jobs_dir)
+    jobs = load_jobs_cached(jobs_dir)
     if job_id not in jobs:
         raise KeyError(f"Job not found: {job_id}. Available: {list(jobs.keys())}")
     return jobs[job_id]
 
 
+def _job_key_lines(lines: List[str]) -> Iterator[Tuple[int, int, str]]:
+    """Yield (line index, indent, line) for each key directly under top-level jobs:."""
+    in_jobs = False
+    child_indent = None
+    for i, line in enumerate(lines):
+        stripped = line.lstrip()
+        if not stripped or stripped.startswith("#"):
+            continue
+        indent = len(line) - len(stripped)
+        if indent == 0:
+            in_jobs = _JOBS_HEADER_RE.match(line) is not None
+            child_indent = None
+            continue
+        if not in_jobs:
+            continue
+        if child_indent is None:
+            child_indent = indent
+        if indent == child_indent:
+            yield i, indent, line
+
+
+def get_job_source(job_id: str, jobs_dir: Path) -> Optional[str]:
+    """Return the YAML text of a job's definition as written in its file.
+
+    Files are scanned in reverse load order (later files win in load_jobs).
+    Only keys directly under the top-level jobs: mapping are considered, and
+    the job's block is sliced by indentation, keeping comments. Returns None
+    if the block can't be located (e.g. quoted or flow-style keys).
+    """
+    header = re.compile(rf"^ +{re.escape(job_id)}:\s*(#.*)?$")
+
+    for yaml_file in sorted(jobs_dir.glob("*.yaml"), reverse=True):
+        lines = yaml_file.read_text().splitlines()
+        for start, indent, line in _job_key_lines(lines):
+            if not header.match(line):
+                continue
+
+            # The block ends at the next non-comment line indented no deeper
+            end = start + 1
+            while end < len(lines):
+                stripped = lines[end].lstrip()
+                if stripped and not stripped.startswith("#"):
+                    if len(lines[end]) - len(stripped) <= indent:
+                        break
+                end += 1
+
+            block = lines[start:end]
+            while block and (not block[-1].strip() or block[-1].lstrip().startswith("#")):
+                block.pop()
+            dedented = [
+                line[indent:] if line[:indent].isspace() else line.lstrip() for line in block
+            ]
+            return "\n".join(dedented) + "\n"
+
+    return None
+
+
 def list_jobs(jobs_dir: Path) -> List[Dict[str, str]]:
     """List all available jobs."""
-    jobs = load_jobs(jobs_dir)
+    jobs = load_jobs_cached(jobs_dir)
     return [
         {"job_id": job_id, "description": spec.get("description", "")}
         for job_id, spec in sorted(jobs.items())
@@ -136,10 +314,12 @@ def run_job(
     dry_run: bool = False,
     jobs_dir: Path,
     event_log: Path,
-    variables: Optional[Dict[str, str]] = None,
+    variables: Optional[Dict[str, Any]] = None,
 ) -> Dict[str, Any]:
     """Run a job by ID.
 
+    Variables may be typed (e.g. bools); see _substitute_variables.
+
     Returns stable shape (Rule 6): {"run_id": str, "status": str, "steps": list}
     No print statements (Rule 2) - CLI handles verbose output.
     """
@@ -153,113 +333,138 @@ def run_job(
     )
 
     # Load job
-    jobs = load_jobs(jobs_dir)
+    jobs = load_jobs_cached(jobs_dir)
     if job_id not in jobs:
         raise KeyError(f"Job not found: {job_id}. Available: {list(jobs.keys())}")
 
     job_spec = jobs[job_id]
     steps = job_spec.get("steps", [])
 
-    # Event logging
-    event_client = EventClient(event_log)
-    event_client.log_event(
-        "job.started", run_id, "success", {"job_id": job_id, "dry_run": dry_run}
-    )
-
-    results: List[Dict[str, Any]] = []
-    try:
-        for step in steps:
-            step_name = step.get("name", "unnamed")
-            call_path = step["call"]
-            args = step.get("args", {})
+    # Event logging: the run's events are written together when the log closes
+    with EventClient(event_log) as event_client:
+        event_client.begin_batch()
+        event_client.log_event(
+            "job.started", run_id, "success", {"job_id": job_id, "dry_run": dry_run}
+        )
 
-            # Substitute variables in args, then check for unsubstituted (Rule 4)
-            if variables:
-                args = _substitute_variables(args, variables)
-            _check_unsubstituted(args, step_name)
+        results: List[Dict[str, Any]] = []
+        try:
+            for step in steps:
+                step_name = step.get("name", "unnamed")
+                call_path = step["call"]
+                args = step.get("args", {})
+
+                # Substitute variables in args and fail on unsubstituted ones (Rule 4)
+                args, unsubstituted = _substitute_variables(args, variables or {})
+                if unsubstituted:
+                    raise UnsubstitutedVariableError(
+                        f"Step '{step_name}' has unsubstituted variables: {sorted(unsubstituted)}"
+                    )
+
+                if dry_run:
+                    results.append(
+                        {
+                            "step": step_name,
+                            "call": call_path,
+                            "args": args,
+                            "status": "skipped",
+                            "dry_run": True,
+                        }
+                    )
+                    continue
+
+                # Resolve and call function (validates allowlist via Rule 3)
+                func = resolve_callable(call_path)
+                result = func(**args)
 
-            if dry_run:
                 results.append(
                     {
                         "step": step_name,
                         "call": call_path,
-                        "args": args,
-                        "status": "skipped",
-                        "dry_run": True,
+                        "status": "success",
+                        "result": result,
                     }
                 )
-                continue
 
-            # Resolve and call function (validates allowlist via Rule 3)
-            func = resolve_callable(call_path)
-            result = func(**args)
-
-            results.append(
-                {
-                    "step": step_name,
-                    "call": call_path,
-                    "status": "success",
-                    "result": result,
-                }
-            )
+                event_client.log_event(
+                    "step.completed",
+                    run_id,
+                    "success",
+                    {"step": step_name, "call": call_path},
+                )
+
+            event_client.log_event("job.completed", run_id, "success", {"job_id": job_id})
+            return {"run_id": run_id, "status": "success", "steps": results}
 
+        except Exception as e:
             event_client.log_event(
-                "step.completed",
-                run_id,
-                "success",
-                {"step": step_name, "call": call_path},
+                "job.failed", run_id, "failed", {"job_id": job_id}, str(e)
             )
-
-        event_client.log_event("job.completed", run_id, "success", {"job_id": job_id})
-        return {"run_id": run_id, "status": "success", "steps": results}
-
-    except Exception as e:
-        event_client.log_event(
-            "job.failed", run_id, "failed", {"job_id": job_id}, str(e)
-        )
-        raise
+            raise
 
 
 # Regex to find {placeholder} patterns
 _PLACEHOLDER_RE = re.compile(r"\{([^}]+)\}")
 
+# Innermost {name} only, so "{{name}}" substitutes to "{value}" as with str.replace
+_SUBSTITUTE_RE = re.compile(r"\{([^{}]+)\}")
 
-def _substitute_variables(obj: Any, variables: Dict[str, str]) -> Any:
-    """Recursively substitute {var} patterns in strings."""
-    if isinstance(obj, str):
-        for key, value in variables.items():
-            obj = obj.replace(f"{{{key}}}", value)
-        return obj
-    elif isinstance(obj, dict):
-        return {k: _substitute_variables(v, variables) for k, v in obj.items()}
-    elif isinstance(obj, list):
-        return [_substitute_variables(item, variables) for item in obj]
-    return obj
+
+def _format_variable(value: Any) -> str:
+    """Render a variable for embedding in a larger string (bools as true/false)."""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return value if isinstance(value, str) else str(value)
 
 
-def _check_unsubstituted(obj: Any, step_name: str) -> None:
-    """Check for remaining {var} placeholders and raise if found (Rule 4).
+def _substitute_variables(obj: Any, variables: Dict[str, Any]) -> Tuple[Any, set]:
+    """Substitute {var} patterns in strings throughout a nested args tree.
+
+    An arg that is exactly "{var}" takes the variable's value as-is, so typed
+    values (e.g. bools) reach the step unchanged. Placeholders embedded in a
+    longer string are replaced with the value's string form, in a single regex
+    pass per string; unknown placeholders are left in place.
+
+    Returns (substituted obj, names of {var} placeholders still present), so
+    the args tree is walked once for both substitution and the Rule 4 check.
 
     Known limitation: If literal {} are needed in arguments (e.g., OData filters),
     introduce an escape convention (e.g., {{literal}}) or per-step `allow_unsubstituted: true`.
     Not implemented yet - just document when needed.
     """
+    formatted = {key: _format_variable(value) for key, value in variables.items()}
     unsubstituted: set = set()
-    _collect_unsubstituted(obj, unsubstituted)
-    if unsubstituted:
-        raise UnsubstitutedVariableError(
-            f"Step '{step_name}' has unsubstituted variables: {sorted(unsubstituted)}"
-        )
 
+    def replace(match: re.Match) -> str:
+        return formatted.get(match.group(1), match.group(0))
+
+    def substitute(value: str) -> Any:
+        if value.startswith("{") and value.endswith("}") and value[1:-1] in variables:
+            value = variables[value[1:-1]]
+        elif "{" in value:
+            value = _SUBSTITUTE_RE.sub(replace, value)
+        if isinstance(value, str) and "{" in value:
+            unsubstituted.update(m.group(1) for m in _PLACEHOLDER_RE.finditer(value))
+        return value
 
-def _collect_unsubstituted(obj: Any, found: set) -> None:
-    """Recursively collect unsubstituted {var} names."""
     if isinstance(obj, str):
-        for match in _PLACEHOLDER_RE.finditer(obj):
-            found.add(match.group(1))
-    elif isinstance(obj, dict):
-        for v in obj.values():
-            _collect_unsubstituted(v, found)
-    elif isinstance(obj, list):
-        for item in obj:
-            _collect_unsubstituted(item, found)
+        return substitute(obj), unsubstituted
+    if not isinstance(obj, (dict, list)):
+        return obj, unsubstituted
+
+    # Walk the tree with an explicit stack, rewriting shallow copies in place
+    root = dict(obj) if isinstance(obj, dict) else list(obj)
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        # Only existing keys are reassigned, so iterating the node itself is safe
+        for key, value in node.items() if isinstance(node, dict) else enumerate(node):
+            if isinstance(value, str):
+                node[key] = substitute(value)
+            elif isinstance(value, dict):
+                node[key] = child = dict(value)
+                stack.append(child)
+            elif isinstance(value, list):
+                node[key] = child = list(value)
+                stack.append(child)
+    return root, unsubstituted
@@ -0,0 +1,57 @@
+"""
+Console entry point for Life-CLI.
+
+Answers `life`, `life --help` and `life version` from pre-built strings
+without importing Typer; everything else is handed to the full CLI app.
+
+Copyright 2025 Ben Mensi
+Licensed under the Apache License, Version 2.0
+"""
+
+import sys
+
+from life import __version__
+from life.commands import SUBCOMMANDS
+
+APP_HELP = "Lightweight, stateful, CLI-first orchestrator for personal data pipelines"
+
+_COMMANDS = {"version": "Show version information."}
+_COMMANDS.update((name, help_text) for name, (_, help_text) in SUBCOMMANDS.items())
+_WIDTH = max(len(name) for name in _COMMANDS)
+
+HELP_TEXT = (
+    "Usage: life [OPTIONS] COMMAND [ARGS]...\n"
+    "\n"
+    f"  {APP_HELP}\n"
+    "\n"
+    "Options:\n"
+    "  -c, --config TEXT  Path to config file (default: ~/life.yml or ./life.yml)\n"
+    "  --dry-run          Show what would be executed without running commands\n"
+    "  -v, --verbose      Enable verbose logging\n"
+    "  --help             Show this message and exit.\n"
+    "\n"
+    "Commands:\n"
+    + "".join(f"  {name:<{_WIDTH}}  {text}\n" for name, text in _COMMANDS.items())
+)
+
+VERSION_LINE = f"life version {__version__}\n"
+
+
+def main() -> None:
+    """Entry point for the `life` console script."""
+    args = sys.argv[1:]
+    if args == ["version"]:
+        sys.stdout.write(VERSION_LINE)
+        sys.exit(0)
+    if not args or args == ["--help"]:
+        sys.stdout.write(HELP_TEXT)
+        # Mirror click's no_args_is_help exit status
+        sys.exit(0 if args else 2)
+
+    from life.cli import main as cli_main
+
+    cli_main()
+
+
+if __name__ == "__main__":
+    main()
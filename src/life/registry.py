@@ -9,6 +9,7 @@ Maintains a registry of known CLI tools with metadata and installation hints.
 
 import shutil
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, List, Optional
 
 
@@ -51,6 +52,22 @@ TOOL_REGISTRY: Dict[str, ToolInfo] = {
 }
 
 
+@lru_cache(maxsize=None)
+def _which(binary: str) -> Optional[str]:
+    """PATH lookup for a binary, memoized since PATH rarely changes in-process."""
+    return shutil.which(binary)
+
+
+def invalidate_tool_cache() -> None:
+    """Forget memoized PATH lookups (e.g. after installing a tool)."""
+    _which.cache_clear()
+
+
+def is_binary_on_path(binary: str) -> bool:
+    """Check if a binary is available on PATH."""
+    return _which(binary) is not None
+
+
 def is_tool_installed(tool_name: str) -> bool:
     """
     Check if a tool is installed and available on PATH.
@@ -62,12 +79,8 @@ def is_tool_installed(tool_name: str) -> bool:
         True if tool binary is found on PATH, False otherwise
     """
     tool_info = TOOL_REGISTRY.get(tool_name)
-    if not tool_info:
-        # For unknown tools, try to find the tool name itself on PATH
-        return shutil.which(tool_name) is not None
-
-    # For registered tools, check if binary exists
-    return shutil.which(tool_info.binary) is not None
+    # For unknown tools, try to find the tool name itself on PATH
+    return is_binary_on_path(tool_info.binary if tool_info else tool_name)
 
 
 def get_tool_info(tool_name: str) -> Optional[ToolInfo]:
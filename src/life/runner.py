@@ -9,12 +9,47 @@ Licensed under the Apache License, Version 2.0
 
 import json
 import logging
+import re
+import shlex
 import subprocess
 from pathlib import Path
 from typing import Dict, List, Optional, Union
 
 import typer
 
+# Escaped braces ({{ and }}) or a {variable} placeholder
+_SUBSTITUTION_RE = re.compile(r"\{\{|\}\}|\{([^{}]+)\}")
+_VARIABLE_NAME_RE = re.compile(r"\w+")
+
+# Anything the shell would interpret beyond plain words and quoting
+_SHELL_SYNTAX_RE = re.compile(r"[|&;<>()$`\\*?\[\]{}~!#\n]")
+
+
+def _simple_argv(command: str) -> Optional[List[str]]:
+    """Split a command that needs no shell features into argv, else None."""
+    if _SHELL_SYNTAX_RE.search(command):
+        return None
+    try:
+        argv = shlex.split(command)
+    except ValueError:
+        return None
+    # A leading VAR=value is a shell environment assignment
+    if not argv or "=" in argv[0]:
+        return None
+    return argv
+
+
+def _run_command(command: str, shell: bool, check: bool) -> subprocess.CompletedProcess:
+    """Run a command, exec'ing plain "binary args..." commands without /bin/sh."""
+    argv = _simple_argv(command) if shell else None
+    if argv is not None:
+        try:
+            return subprocess.run(argv, check=check, capture_output=True, text=True)
+        except OSError:
+            # Builtins (exit, cd...) and unrunnable binaries: let the shell handle them
+            pass
+    return subprocess.run(command, shell=shell, check=check, capture_output=True, text=True)
+
 
 class CommandRunner:
     """Executes shell commands with variable substitution."""
@@ -50,28 +85,30 @@ class CommandRunner:
             >>> substitute_variables("echo {{literal}}", {})
             'echo {literal}'
         """
-        import re
-
-        # First, temporarily replace escaped braces {{...}} with a placeholder
-        escape_open = "\x00ESCAPED_OPEN\x00"
-        escape_close = "\x00ESCAPED_CLOSE\x00"
-        result = command.replace("{{", escape_open).replace("}}", escape_close)
-
-        # Substitute variables
-        for key, value in variables.items():
-            placeholder = f"{{{key}}}"
-            if placeholder in result:
-                result = result.replace(placeholder, str(value))
+        remaining = []
+
+        def replace(match: re.Match) -> str:
+            token = match.group(0)
+            if token == "{{":
+                return "{"
+            if token == "}}":
+                return "}"
+            key = match.group(1)
+            if key in variables:
+                value = variables[key]
                 self.logger.debug(f"Substituted {{{key}}} -> {value}")
+                return str(value)
+            if _VARIABLE_NAME_RE.fullmatch(key):
+                remaining.append(key)
+            return token
+
+        # One left-to-right pass handles escapes and placeholders together
+        result = _SUBSTITUTION_RE.sub(replace, command)
 
-        # Check for unsubstituted variables (but ignore our placeholders)
-        remaining = re.findall(r'\{(\w+)\}', result)
+        # Warn about unsubstituted variables (escaped braces are not counted)
         if remaining:
             self.logger.warning(f"Unsubstituted variables: {remaining}")
 
-        # Restore escaped braces
-        result = result.replace(escape_open, "{").replace(escape_close, "}")
-
         return result
 
     def run(
@@ -116,13 +153,7 @@ class CommandRunner:
         self.logger.info(log_msg)
 
         try:
-            result = subprocess.run(
-                final_command,
-                shell=shell,
-                check=check,
-                capture_output=True,
-                text=True,
-            )
+            result = _run_command(final_command, shell=shell, check=check)
 
             if self.verbose and result.stdout:
                 self.logger.debug(f"STDOUT:\n{result.stdout}")
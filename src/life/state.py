@@ -9,9 +9,42 @@ Licensed under the Apache License, Version 2.0
 
 import json
 import logging
-from datetime import datetime
+import os
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Set, Union
+from urllib.parse import quote, unquote
+
+_ISO_FMT = "%Y-%m-%dT%H:%M:%S.%fZ"
+
+# Prefer orjson for reading and writing state; fall back to the stdlib codec
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps(state: Dict[str, Any]) -> bytes:
+        return orjson.dumps(state, option=orjson.OPT_INDENT_2)
+
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(state: Dict[str, Any]) -> bytes:
+        return json.dumps(state, indent=2, ensure_ascii=False).encode()
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write data via a temp file and rename, so readers never see a partial file."""
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except OSError:
+        tmp.unlink(missing_ok=True)
+        raise
 
 
 class StateManager:
@@ -25,42 +58,149 @@ class StateManager:
             "last_run": "2025-11-10T10:35:00Z"
         }
     }
+
+    With per_task=True (or when state_file is an existing directory or a
+    path ending in "/"), each task is instead stored as
+    <state_file>/<task_name>.json holding that task's dict, with the task
+    name percent-encoded, and only the tasks that changed are rewritten. State is read
+    lazily: per-task lookups read just that task's file, and the whole state
+    is loaded only when the state attribute is used.
+
+    Updates are saved immediately unless autosave is off or the manager is
+    used as a context manager, in which case they are written once by
+    flush() (called on exit).
     """
 
-    def __init__(self, state_file: Path):
+    def __init__(
+        self,
+        state_file: Union[str, Path],
+        autosave: bool = True,
+        per_task: Optional[bool] = None,
+    ):
         """
         Initialize state manager.
 
         Args:
-            state_file: Path to JSON state file
+            state_file: Path to JSON state file, or to a per-task state directory
+            autosave: Save after every update (otherwise call flush())
+            per_task: Use the per-task directory layout (default: only if
+                state_file is an existing directory or ends in "/")
         """
         self.state_file = Path(state_file).expanduser()
+        if per_task is None:
+            # Path() drops a trailing separator, so check the raw string
+            per_task = self.state_file.is_dir() or str(state_file).endswith(("/", os.sep))
+        self.per_task = per_task
+        self.autosave = autosave
         self.logger = logging.getLogger(__name__)
-        self.state = self._load()
+        self._state: Dict[str, Any] = {}
+        self._loaded = False  # whole state read (file, or every task file)
+        self._tasks_read: Set[str] = set()  # tasks resolved individually
+        self._dirty_tasks: Set[str] = set()
+        self._batch_depth = 0
+
+    @property
+    def state(self) -> Dict[str, Any]:
+        """The complete state dict, loaded on first access."""
+        if not self._loaded:
+            state = self._load()
+            # Tasks already read or updated individually take precedence
+            for task_name in self._tasks_read:
+                if task_name in self._state:
+                    state[task_name] = self._state[task_name]
+                else:
+                    state.pop(task_name, None)
+            self._state = state
+            self._loaded = True
+        return self._state
+
+    def _get_task(self, task_name: str) -> Optional[Dict[str, Any]]:
+        """A task's state, reading only its own file in the per-task layout."""
+        if not self.per_task or self._loaded:
+            return self.state.get(task_name)
+        if task_name not in self._tasks_read:
+            self._tasks_read.add(task_name)
+            task_file = self._task_file(task_name)
+            task_state = self._read_json(task_file) if task_file.exists() else None
+            if task_state is not None:
+                self._state[task_name] = task_state
+        return self._state.get(task_name)
+
+    def __enter__(self) -> "StateManager":
+        self._batch_depth += 1
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._batch_depth -= 1
+        self.flush()
+
+    def _task_file(self, task_name: str) -> Path:
+        """Path of a task's file in the per-task layout.
+
+        The name is percent-encoded so names like "a/b" or ".." stay a
+        single file inside the state directory.
+        """
+        return self.state_file / f"{quote(task_name, safe='')}.json"
+
+    def _read_json(self, path: Path) -> Optional[Dict[str, Any]]:
+        """Parse a state JSON file, or None (with a warning) if it is invalid."""
+        try:
+            return _loads(path.read_bytes())
+        except json.JSONDecodeError as e:
+            self.logger.warning(f"Invalid state file {path}: {e}")
+            return None
 
     def _load(self) -> Dict[str, Any]:
-        """Load state from JSON file."""
+        """Load state from the JSON file or per-task directory."""
+        if self.per_task:
+            self.state_file.mkdir(parents=True, exist_ok=True)
+            state = {}
+            for path in self.state_file.glob("*.json"):
+                task_state = self._read_json(path)
+                if task_state is not None:
+                    state[unquote(path.stem)] = task_state
+            self.logger.debug(f"Loaded state from: {self.state_file}")
+            return state
+
         if not self.state_file.exists():
             self.logger.debug(f"State file not found, creating: {self.state_file}")
             self.state_file.parent.mkdir(parents=True, exist_ok=True)
             return {}
 
-        try:
-            with open(self.state_file, "r") as f:
-                state = json.load(f)
-            self.logger.debug(f"Loaded state from: {self.state_file}")
-            return state
-        except json.JSONDecodeError as e:
-            self.logger.warning(f"Invalid state file {self.state_file}: {e}")
+        state = self._read_json(self.state_file)
+        if state is None:
             return {}
+        self.logger.debug(f"Loaded state from: {self.state_file}")
+        return state
 
     def _save(self):
-        """Save state to JSON file."""
-        self.state_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.state_file, "w") as f:
-            json.dump(self.state, f, indent=2)
+        """Atomically save changed state (readers never see a partial write)."""
+        if self.per_task:
+            self.state_file.mkdir(parents=True, exist_ok=True)
+            for task_name in sorted(self._dirty_tasks):
+                task_file = self._task_file(task_name)
+                if task_name in self._state:
+                    _write_atomic(task_file, _dumps(self._state[task_name]))
+                else:
+                    task_file.unlink(missing_ok=True)
+        else:
+            data = _dumps(self.state)
+            self.state_file.parent.mkdir(parents=True, exist_ok=True)
+            _write_atomic(self.state_file, data)
+        self._dirty_tasks.clear()
         self.logger.debug(f"Saved state to: {self.state_file}")
 
+    def _mark_dirty(self, task_name: str):
+        """Record an update to a task, saving now unless writes are being deferred."""
+        self._dirty_tasks.add(task_name)
+        if self.autosave and not self._batch_depth:
+            self._save()
+
+    def flush(self):
+        """Save state if there are unsaved updates."""
+        if self._dirty_tasks:
+            self._save()
+
     def get_high_water_mark(self, task_name: str, field: str) -> Optional[str]:
         """
         Get the high-water mark for a task's incremental field.
@@ -72,7 +212,7 @@ class StateManager:
         Returns:
             High-water mark value (e.g., "2025-11-10T10:30:00Z") or None if never synced
         """
-        task_state = self.state.get(task_name, {})
+        task_state = self._get_task(task_name) or {}
         return task_state.get(field)
 
     def set_high_water_mark(self, task_name: str, field: str, value: str):
@@ -84,12 +224,13 @@ class StateManager:
             field: Field name (e.g., "modified_on")
             value: New high-water mark value
         """
-        if task_name not in self.state:
-            self.state[task_name] = {}
+        task_state = self._get_task(task_name)
+        if task_state is None:
+            task_state = self._state[task_name] = {}
 
-        self.state[task_name][field] = value
-        self.state[task_name]["last_run"] = datetime.utcnow().isoformat() + "Z"
-        self._save()
+        task_state[field] = value
+        task_state["last_run"] = datetime.now(timezone.utc).strftime(_ISO_FMT)
+        self._mark_dirty(task_name)
         self.logger.debug(f"Updated {task_name}.{field} = {value}")
 
     def get_last_run(self, task_name: str) -> Optional[str]:
@@ -102,7 +243,7 @@ class StateManager:
         Returns:
             ISO 8601 timestamp or None if never run
         """
-        task_state = self.state.get(task_name, {})
+        task_state = self._get_task(task_name) or {}
         return task_state.get("last_run")
 
     def clear_task(self, task_name: str):
@@ -112,9 +253,9 @@ class StateManager:
         Args:
             task_name: Name of the sync task
         """
-        if task_name in self.state:
-            del self.state[task_name]
-            self._save()
+        if self._get_task(task_name) is not None:
+            del self._state[task_name]
+            self._mark_dirty(task_name)
             self.logger.info(f"Cleared state for task: {task_name}")
 
     def get_all_state(self) -> Dict[str, Any]:
@@ -8,24 +8,54 @@ Validates YAML configuration structure and provides helpful error messages.
 """
 
 import logging
-from typing import Any, Dict, List, Set
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, List, Set
 
 logger = logging.getLogger(__name__)
 
+# Max edit distance for suggest_fix suggestions
+_MAX_SUGGEST_DISTANCE = 2
+
+# Prefer rapidfuzz's C Levenshtein (stops early past the cutoff); fall back to
+# a pure-Python implementation if unavailable
+try:
+    from rapidfuzz.distance.Levenshtein import distance as _levenshtein
+
+    def _edit_distance(s1: str, s2: str) -> int:
+        return _levenshtein(s1, s2, score_cutoff=_MAX_SUGGEST_DISTANCE)
+
+except ImportError:
+
+    def _edit_distance(s1: str, s2: str) -> int:
+        if len(s1) > len(s2):
+            s1, s2 = s2, s1
+        distances = range(len(s1) + 1)
+        for i2, c2 in enumerate(s2):
+            distances_ = [i2 + 1]
+            for i1, c1 in enumerate(s1):
+                if c1 == c2:
+                    distances_.append(distances[i1])
+                else:
+                    distances_.append(1 + min((distances[i1], distances[i1 + 1], distances_[-1])))
+            distances = distances_
+        return distances[-1]
+
 # Valid top-level keys in config
-VALID_TOP_LEVEL_KEYS = {"workspace", "sync", "merge", "process", "status", "today", "gen", "email", "jobs", "pipeline"}
+VALID_TOP_LEVEL_KEYS = frozenset({
+    "workspace", "sync", "merge", "process", "status", "today", "gen", "email", "jobs", "pipeline",
+})
 
 # Required fields per task type
 TASK_REQUIRED_FIELDS = {
-    "sync": {"command"},  # Either command or commands, validated separately
-    "merge": {"command"},
-    "process": {"command"},
-    "status": {"command"},
-    "gen": {"command"},
+    "sync": frozenset({"command"}),  # Either command or commands, validated separately
+    "merge": frozenset({"command"}),
+    "process": frozenset({"command"}),
+    "status": frozenset({"command"}),
+    "gen": frozenset({"command"}),
 }
 
 # Optional but recognized fields
-TASK_OPTIONAL_FIELDS = {
+TASK_OPTIONAL_FIELDS = frozenset({
     "description",
     "output",
     "commands",
@@ -39,13 +69,19 @@ TASK_OPTIONAL_FIELDS = {
     "mode",
     "condition",  # For conditional command execution
     "prompt",     # For HITL prompts
+})
+
+# All recognized fields per task category (required | optional)
+_KNOWN_FIELDS_BY_CATEGORY = {
+    category: required | TASK_OPTIONAL_FIELDS
+    for category, required in TASK_REQUIRED_FIELDS.items()
 }
 
 # Valid condition types
-VALID_CONDITION_TYPES = {"file_exists", "file_not_empty", "json_has_field"}
+VALID_CONDITION_TYPES = frozenset({"file_exists", "file_not_empty", "json_has_field"})
 
 # Valid prompt fields
-VALID_PROMPT_FIELDS = {"message", "preview_file", "preview_lines", "type"}
+VALID_PROMPT_FIELDS = frozenset({"message", "preview_file", "preview_lines", "type"})
 
 
 def validate_config(config: Dict[str, Any]) -> List[str]:
@@ -61,7 +97,7 @@ def validate_config(config: Dict[str, Any]) -> List[str]:
     issues = []
 
     # Check for unknown top-level keys
-    unknown_keys = set(config.keys()) - VALID_TOP_LEVEL_KEYS
+    unknown_keys = config.keys() - VALID_TOP_LEVEL_KEYS
     if unknown_keys:
         issues.append(
             f"Unknown top-level config keys: {', '.join(sorted(unknown_keys))}. "
@@ -153,8 +189,8 @@ def _validate_task(task_path: str, task_config: Dict[str, Any], category: str) -
         )
 
     # Check for unknown fields (potential typos)
-    known_fields = TASK_REQUIRED_FIELDS.get(category, set()) | TASK_OPTIONAL_FIELDS
-    unknown_fields = set(task_config.keys()) - known_fields
+    known_fields = _KNOWN_FIELDS_BY_CATEGORY.get(category, TASK_OPTIONAL_FIELDS)
+    unknown_fields = task_config.keys() - known_fields
     if unknown_fields:
         logger.debug(
             f"{task_path}: Unrecognized fields: {', '.join(sorted(unknown_fields))}. "
@@ -205,7 +241,7 @@ def _validate_command_item(item_path: str, cmd_item: Dict[str, Any]) -> List[str
                 issues.append(f"{item_path}.prompt: Missing required field 'message'")
 
             # Check for unknown fields in prompt
-            unknown_prompt_fields = set(prompt_config.keys()) - VALID_PROMPT_FIELDS
+            unknown_prompt_fields = prompt_config.keys() - VALID_PROMPT_FIELDS
             if unknown_prompt_fields:
                 issues.append(
                     f"{item_path}.prompt: Unknown fields: {', '.join(sorted(unknown_prompt_fields))}"
@@ -220,7 +256,7 @@ def _validate_command_item(item_path: str, cmd_item: Dict[str, Any]) -> List[str
             )
         else:
             # Check for valid condition types
-            unknown_conditions = set(condition.keys()) - VALID_CONDITION_TYPES
+            unknown_conditions = condition.keys() - VALID_CONDITION_TYPES
             if unknown_conditions:
                 issues.append(
                     f"{item_path}.condition: Unknown condition types: {', '.join(sorted(unknown_conditions))}. "
@@ -253,27 +289,19 @@ def suggest_fix(typo: str, valid_options: Set[str]) -> str:
     Returns:
         Suggested correction or empty string if no close match
     """
-    # Simple distance calculation (Levenshtein would be better)
-    def distance(s1: str, s2: str) -> int:
-        if len(s1) > len(s2):
-            s1, s2 = s2, s1
-        distances = range(len(s1) + 1)
-        for i2, c2 in enumerate(s2):
-            distances_ = [i2 + 1]
-            for i1, c1 in enumerate(s1):
-                if c1 == c2:
-                    distances_.append(distances[i1])
-                else:
-                    distances_.append(1 + min((distances[i1], distances[i1 + 1], distances_[-1])))
-            distances = distances_
-        return distances[-1]
+    # frozenset() of a frozenset (e.g. VALID_TOP_LEVEL_KEYS) is a no-op
+    return _suggest_fix(typo, frozenset(valid_options))
+
 
+@lru_cache(maxsize=256)
+def _suggest_fix(typo: str, valid_options: FrozenSet[str]) -> str:
+    """Memoized suggest_fix for a hashable option set."""
     best_match = None
     best_distance = float("inf")
 
     for option in valid_options:
-        dist = distance(typo.lower(), option.lower())
-        if dist < best_distance and dist <= 2:  # Max distance of 2 for suggestions
+        dist = _edit_distance(typo.lower(), option.lower())
+        if dist < best_distance and dist <= _MAX_SUGGEST_DISTANCE:
             best_distance = dist
             best_match = option
 
@@ -0,0 +1,52 @@
+"""Shared API client construction for life_jobs step functions.
+
+Copyright 2025 Ben Mensi
+Licensed under the Apache License, Version 2.0
+"""
+
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+# Seconds a cached client is reused before being rebuilt (so auth is refreshed)
+CLIENT_TTL_SECONDS = 300.0
+
+# Per-thread client cache: the underlying HTTP sessions (requests, httplib2)
+# are not safe to share between concurrent senders
+_local = threading.local()
+
+
+def cached_client(
+    client_cls: Any, account: str, scopes: Optional[Tuple[str, ...]] = None
+) -> Any:
+    """Build a client via client_cls.from_authctl, reused per thread.
+
+    Client construction loads credentials and sets up an HTTP session, so
+    repeated calls on the same thread with the same (class, account, scopes)
+    reuse one client for up to CLIENT_TTL_SECONDS. Each thread gets its own
+    client, and failed constructions are not cached.
+
+    Args:
+        client_cls: Client class with a from_authctl constructor
+        account: authctl account name for authentication
+        scopes: OAuth scopes to request, if the client takes them
+
+    Returns:
+        The client instance
+    """
+    cache: Optional[Dict[Tuple, Tuple[Any, float]]] = getattr(_local, "clients", None)
+    if cache is None:
+        cache = _local.clients = {}
+
+    key = (client_cls, account, scopes)
+    now = time.monotonic()
+    cached = cache.get(key)
+    if cached is not None and now - cached[1] < CLIENT_TTL_SECONDS:
+        return cached[0]
+
+    if scopes is None:
+        client = client_cls.from_authctl(account)
+    else:
+        client = client_cls.from_authctl(account, scopes=list(scopes))
+    cache[key] = (client, now)
+    return client
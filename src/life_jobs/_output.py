@@ -0,0 +1,110 @@
+"""Shared output writing for life_jobs step functions.
+
+Copyright 2025 Ben Mensi
+Licensed under the Apache License, Version 2.0
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Iterable, List
+
+# Prefer orjson for encoding records; fall back to the stdlib encoder
+try:
+    import orjson
+
+    _ORJSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+    def _dumps(record: Any) -> bytes:
+        return orjson.dumps(record, default=str, option=_ORJSON_OPTIONS)
+
+except ImportError:
+
+    def _dumps(record: Any) -> bytes:
+        return json.dumps(record, indent=2, default=str).encode()
+
+
+# Import guard: msgspec is an optional dependency (for .msgpack outputs)
+try:
+    import msgspec as _msgspec
+except ImportError:
+    _msgspec = None
+
+MSGPACK_SUFFIX = ".msgpack"
+
+# Write buffer for streamed outputs; batches many small record writes into
+# filesystem-block-sized syscalls
+_WRITE_BUFFER_SIZE = 64 * 1024
+
+
+def _require_msgspec() -> None:
+    """Raise clear error if msgspec library not installed."""
+    if _msgspec is None:
+        raise ImportError(
+            "msgspec library not installed. Install with: pip install 'life[msgpack]'"
+        )
+
+
+def write_json_records(output_path: Path, records: Iterable[Any]) -> int:
+    """Stream records to a file as an indented JSON array.
+
+    Records are encoded and written one at a time, so the full document is
+    never held in memory as a string. The layout matches
+    json.dumps(records, indent=2).
+
+    Args:
+        output_path: File to write (parent directories are created)
+        records: Records to write
+
+    Returns:
+        Number of records written
+    """
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    count = 0
+    with open(output_path, "wb", buffering=_WRITE_BUFFER_SIZE) as f:
+        for record in records:
+            f.write(b"[\n  " if count == 0 else b",\n  ")
+            # Encoded JSON strings never contain a raw newline, so this only
+            # indents the record's own line breaks one level deeper
+            f.write(_dumps(record).replace(b"\n", b"\n  "))
+            count += 1
+        f.write(b"\n]" if count else b"[]")
+    return count
+
+
+def write_records(output_path: Path, records: Iterable[Any]) -> int:
+    """Write records as JSON, or as MessagePack if the path ends in .msgpack.
+
+    MessagePack is smaller and much faster to encode and decode, for outputs
+    that are only read by later steps; JSON stays the default.
+
+    Args:
+        output_path: File to write (parent directories are created)
+        records: Records to write
+
+    Returns:
+        Number of records written
+    """
+    if output_path.suffix != MSGPACK_SUFFIX:
+        return write_json_records(output_path, records)
+
+    _require_msgspec()
+    records = list(records)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_bytes(_msgspec.msgpack.encode(records, enc_hook=str))
+    return len(records)
+
+
+def load_records(path: Path) -> List[Any]:
+    """Read records written by write_records (JSON or .msgpack).
+
+    Args:
+        path: File to read
+
+    Returns:
+        The decoded records
+    """
+    if path.suffix != MSGPACK_SUFFIX:
+        return json.loads(path.read_text())
+
+    _require_msgspec()
+    return _msgspec.msgpack.decode(path.read_bytes())
@@ -17,12 +17,14 @@ __io__ = {
     "external": ["dataverse.query", "dataverse.post", "dataverse.patch", "dataverse.delete"],
 }
 
-import json
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from morch import DataverseClient
 
+from life_jobs._clients import cached_client
+from life_jobs._output import write_records
+
 
 def query(
     account: str,
@@ -44,12 +46,12 @@ def query(
         orderby: OData orderby expression
         top: Maximum number of records
         expand: OData expand expression
-        output: Optional path to write JSON results
+        output: Optional path to write results (JSON, or MessagePack for .msgpack)
 
     Returns:
         Dict with records count, records list, and output path if written
     """
-    client = DataverseClient.from_authctl(account)
+    client = cached_client(DataverseClient, account)
 
     records = client.query(
         entity,
@@ -64,8 +66,7 @@ def query(
 
     if output:
         output_path = Path(output).expanduser()
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(json.dumps(records, indent=2, default=str))
+        write_records(output_path, records)
         result["output"] = str(output_path)
 
     return result
@@ -88,7 +89,7 @@ def get_single(
     Returns:
         The record as a dict
     """
-    client = DataverseClient.from_authctl(account)
+    client = cached_client(DataverseClient, account)
     return client.query_single(entity, record_id, select=select)
 
 
@@ -107,7 +108,7 @@ def create(
     Returns:
         The created record
     """
-    client = DataverseClient.from_authctl(account)
+    client = cached_client(DataverseClient, account)
     return client.post(entity, data)
 
 
@@ -128,7 +129,7 @@ def update(
     Returns:
         The updated record
     """
-    client = DataverseClient.from_authctl(account)
+    client = cached_client(DataverseClient, account)
     return client.patch(entity, record_id, data)
 
 
@@ -147,6 +148,6 @@ def delete(
     Returns:
         Dict confirming deletion
     """
-    client = DataverseClient.from_authctl(account)
+    client = cached_client(DataverseClient, account)
     client.delete(entity, record_id)
     return {"deleted": True, "entity": entity, "record_id": record_id}
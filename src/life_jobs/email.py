@@ -17,19 +17,158 @@ Licensed under the Apache License, Version 2.0
 """
 
 import json
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Deque, Dict, Iterator, List, Optional, TextIO, Tuple, Union
 
 import jinja2
 import yaml
 from morch import GraphClient
 
+from life_jobs._clients import cached_client
+
+# Prefer the libyaml-backed loader; fall back to pure Python if unavailable
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
+# Maximum concurrent sends in batch_send (kept low to respect provider throttling)
+BATCH_SEND_WORKERS = 8
+
+# Maximum sub-requests in one Graph JSON batch (a Graph API limit)
+GRAPH_BATCH_SIZE = 20
+
+# Shared environment so compiled templates are reused across sends
+_JINJA_ENV = jinja2.Environment(autoescape=False)
+
+
+class _TemplateFormatError(ValueError):
+    """Raised when a template file is missing its YAML frontmatter."""
+
+    pass
+
+
+# (frontmatter, subject template, body template)
+_CompiledTemplate = Tuple[Dict[str, Any], jinja2.Template, jinja2.Template]
+
+
+@lru_cache(maxsize=32)
+def _load_template(path: str, mtime_ns: int) -> _CompiledTemplate:
+    """Parse and compile a template file once per (path, mtime)."""
+    content = Path(path).read_text()
+    if not content.startswith("---"):
+        raise _TemplateFormatError("Template must have YAML frontmatter with subject")
+
+    # Slice around the closing --- rather than splitting the whole template
+    end = content.find("---", 3)
+    if end == -1:
+        raise _TemplateFormatError("Invalid template format: missing closing ---")
+
+    frontmatter = yaml.load(content[3:end], Loader=_Loader) or {}
+    subject_template = _JINJA_ENV.from_string(frontmatter.get("subject", ""))
+    body_template = _JINJA_ENV.from_string(content[end + 3:].strip())
+    return frontmatter, subject_template, body_template
+
+
+class _NotJSONArrayError(ValueError):
+    """Raised when a recipients file is valid JSON but not a top-level array."""
+
+    pass
+
+
+_JSON_DECODER = json.JSONDecoder()
+_JSON_WHITESPACE = " \t\n\r"
+_JSON_DELIMITERS = _JSON_WHITESPACE + ",]"
+
+
+def _iter_json_array(fh: TextIO, chunk_size: int = 65536) -> Iterator[Any]:
+    """Yield the items of a top-level JSON array, reading fh in chunks.
+
+    Raises json.JSONDecodeError for malformed JSON and _NotJSONArrayError if
+    the document is not an array.
+    """
+    buf = ""
+    pos = 0
+    eof = False
+
+    def fill() -> None:
+        nonlocal buf, pos, eof
+        chunk = fh.read(chunk_size)
+        buf = buf[pos:] + chunk
+        pos = 0
+        eof = not chunk
+
+    def peek() -> str:
+        """Skip whitespace and return the next character ("" at end of file)."""
+        nonlocal pos
+        while True:
+            while pos < len(buf) and buf[pos] in _JSON_WHITESPACE:
+                pos += 1
+            if pos < len(buf) or eof:
+                return buf[pos:pos + 1]
+            fill()
+
+    first = peek()
+    if first != "[":
+        # Surface the same errors json.loads would for non-array documents
+        _JSON_DECODER.decode(buf + fh.read())
+        raise _NotJSONArrayError("Recipients file must contain a JSON array")
+    pos += 1
+
+    if peek() == "]":
+        pos += 1
+    else:
+        while True:
+            peek()
+            # Decode one item, reading more until it is followed by a delimiter
+            # (a number such as "1.5" may be cut off at the buffer end)
+            while True:
+                try:
+                    item, end = _JSON_DECODER.raw_decode(buf, pos)
+                except json.JSONDecodeError:
+                    if eof:
+                        raise
+                    fill()
+                    continue
+                if eof or (end < len(buf) and buf[end] in _JSON_DELIMITERS):
+                    break
+                fill()
+            pos = end
+            yield item
+
+            sep = peek()
+            pos += 1
+            if sep == "]":
+                break
+            if sep != ",":
+                raise json.JSONDecodeError("Expecting ',' delimiter", buf, pos - 1)
+
+    if peek():
+        raise json.JSONDecodeError("Extra data", buf, pos)
+
+
+def _check_json_array(path: Path) -> None:
+    """Scan a recipients file's top-level array without keeping its items.
+
+    Raises the same errors as _iter_json_array.
+    """
+    with open(path) as fh:
+        for _ in _iter_json_array(fh):
+            pass
+
+
+# Strings treated as true by _to_bool (compared lowercased)
+_TRUE_VALUES = frozenset({"true", "1", "yes"})
+
 
 def _to_bool(value: Union[bool, str]) -> bool:
     """Convert string/bool to bool (for job runner string passing)."""
-    if isinstance(value, bool):
-        return value
-    return str(value).lower() in ("true", "1", "yes")
+    if isinstance(value, str):
+        return value.lower() in _TRUE_VALUES
+    return bool(value)
 
 # I/O declaration for static analysis and auditing
 __io__ = {
@@ -39,6 +178,71 @@ __io__ = {
 }
 
 
+def _graph_message(to: List[str], subject: str, body: str, is_html: bool) -> Dict[str, Any]:
+    """Build a Graph sendMail message."""
+    return {
+        "subject": subject,
+        "body": {
+            "contentType": "HTML" if is_html else "Text",
+            "content": body,
+        },
+        "toRecipients": [{"emailAddress": {"address": addr}} for addr in to],
+    }
+
+
+def _graph_batch_post(client: Any, messages: List[Dict[str, Any]]) -> Any:
+    """POST messages to /me/sendMail in a single Graph $batch request.
+
+    Returns:
+        The raw $batch response
+    """
+    return client.post(
+        "/$batch",
+        {
+            "requests": [
+                {
+                    "id": str(i),
+                    "method": "POST",
+                    "url": "/me/sendMail",
+                    "headers": {"Content-Type": "application/json"},
+                    "body": {"message": message},
+                }
+                for i, message in enumerate(messages)
+            ]
+        },
+    )
+
+
+def _graph_batch_errors(response: Any, count: int) -> List[Optional[str]]:
+    """Per-message errors (None if accepted) from a $batch response, in message order.
+
+    Never raises: the batch was already accepted, so a response of an
+    unexpected shape is reported against the affected messages rather than
+    retried (which could send duplicates).
+    """
+    errors: List[Optional[str]] = ["No response for message in batch"] * count
+    responses = response.get("responses") if isinstance(response, dict) else None
+    if not isinstance(responses, list):
+        return [f"Unexpected $batch response: {response!r}"] * count
+
+    for sub in responses:
+        try:
+            index = int(sub["id"])
+            status = int(sub.get("status", 0))
+        except (TypeError, ValueError, KeyError, AttributeError):
+            continue
+        if not 0 <= index < count:
+            continue
+        if 200 <= status < 300:
+            errors[index] = None
+        else:
+            body = sub.get("body")
+            error = body.get("error") if isinstance(body, dict) else None
+            detail = error.get("message") if isinstance(error, dict) else None
+            errors[index] = detail or f"HTTP {status}"
+    return errors
+
+
 def _send_via_provider(
     provider: str,
     account: str,
@@ -64,21 +268,13 @@ def _send_via_provider(
         if provider == "gmail":
             from gorch.gmail import GmailClient
 
-            client = GmailClient.from_authctl(account)
+            client = cached_client(GmailClient, account)
             # GmailClient only accepts single recipient; loop for multiple
             for recipient in to:
                 client.send_message(recipient, subject, body, html=is_html)
         else:  # msgraph (default)
-            client = GraphClient.from_authctl(account, scopes=["Mail.Send"])
-            message = {
-                "subject": subject,
-                "body": {
-                    "contentType": "HTML" if is_html else "Text",
-                    "content": body,
-                },
-                "toRecipients": [{"emailAddress": {"address": addr}} for addr in to],
-            }
-            client.post("/me/sendMail", {"message": message})
+            client = cached_client(GraphClient, account, ("Mail.Send",))
+            client.post("/me/sendMail", {"message": _graph_message(to, subject, body, is_html)})
         return {"sent": True, "to": to, "subject": subject, "error": None}
     except Exception as e:
         return {"sent": False, "to": to, "subject": subject, "error": str(e)}
@@ -111,6 +307,115 @@ def send(
     return _send_via_provider(provider, account, to, subject, body, is_html)
 
 
+def _compile_template_file(
+    template_path: Path,
+) -> Tuple[Optional[_CompiledTemplate], Optional[str]]:
+    """Compile a template file, returning (compiled, None) or (None, error)."""
+    try:
+        return _load_template(str(template_path), template_path.stat().st_mtime_ns), None
+    except _TemplateFormatError as e:
+        return None, str(e)
+    except jinja2.TemplateError as e:
+        return None, f"Template rendering error: {e}"
+
+
+def _render(
+    template_path: Path, compiled: _CompiledTemplate, context: Dict[str, Any]
+) -> Tuple[str, str, bool]:
+    """Render (subject, body, is_html) for one recipient."""
+    frontmatter, subject_template, body_template = compiled
+    subject = subject_template.render(**context)
+    body = body_template.render(**context)
+    # Determine if HTML based on frontmatter or file extension
+    is_html = frontmatter.get("html", template_path.suffix == ".html")
+    return subject, body, is_html
+
+
+def _render_error(to: str, error: jinja2.TemplateError) -> Dict[str, Any]:
+    """Send result for a recipient whose template failed to render."""
+    return {
+        "sent": False,
+        "to": to,
+        "subject": None,
+        "error": f"Template rendering error: {error}",
+    }
+
+
+def _render_and_send(
+    account: str,
+    to: str,
+    template_path: Path,
+    compiled: _CompiledTemplate,
+    context: Dict[str, Any],
+    provider: str,
+) -> Dict[str, Any]:
+    """Render a compiled template for one recipient and send it."""
+    try:
+        subject, body, is_html = _render(template_path, compiled, context)
+    except jinja2.TemplateError as e:
+        return _render_error(to, e)
+
+    # Send via provider
+    result = _send_via_provider(provider, account, [to], subject, body, is_html)
+    # Preserve return shape: to is a string, not a list
+    return {
+        "sent": result["sent"],
+        "to": to,
+        "subject": result["subject"],
+        "error": result["error"],
+    }
+
+
+def _render_and_send_graph_batch(
+    account: str,
+    template_path: Path,
+    compiled: _CompiledTemplate,
+    entries: List[Tuple[str, Dict[str, Any], Future]],
+) -> None:
+    """Render a group of recipients and send them in one Graph $batch.
+
+    Each entry's future is resolved with the same result shape as
+    _render_and_send. If the batch request itself raises, the messages are
+    sent one by one instead; once it is accepted, nothing is resent.
+    """
+    try:
+        rendered = []
+        for to, context, future in entries:
+            try:
+                subject, body, is_html = _render(template_path, compiled, context)
+            except jinja2.TemplateError as e:
+                future.set_result(_render_error(to, e))
+                continue
+            rendered.append((to, future, subject, body, is_html))
+
+        if not rendered:
+            return
+
+        messages = [
+            _graph_message([to], subj, body, html) for to, _, subj, body, html in rendered
+        ]
+        try:
+            client = cached_client(GraphClient, account, ("Mail.Send",))
+            response = _graph_batch_post(client, messages)
+        except Exception:
+            # The batch request itself failed; fall back to one request per message
+            errors = [
+                _send_via_provider("msgraph", account, [to], subj, body, html)["error"]
+                for to, _, subj, body, html in rendered
+            ]
+        else:
+            errors = _graph_batch_errors(response, len(messages))
+
+        for (to, future, subject, _, _), error in zip(rendered, errors):
+            future.set_result({"sent": error is None, "to": to, "subject": subject, "error": error})
+    except BaseException as e:
+        # Never leave a recipient's future unresolved
+        for _, _, future in entries:
+            if not future.done():
+                future.set_exception(e)
+        raise
+
+
 def send_templated(
     account: str,
     to: str,
@@ -152,59 +457,16 @@ def send_templated(
             "error": f"Template not found: {template}",
         }
 
-    # Parse template with YAML frontmatter
-    content = template_path.read_text()
-    ctx = context or {}
-
-    # Split frontmatter and body
-    if content.startswith("---"):
-        parts = content.split("---", 2)
-        if len(parts) >= 3:
-            frontmatter = yaml.safe_load(parts[1]) or {}
-            body_template = parts[2].strip()
-        else:
-            return {
-                "sent": False,
-                "to": to,
-                "subject": None,
-                "error": "Invalid template format: missing closing ---",
-            }
-    else:
-        return {
-            "sent": False,
-            "to": to,
-            "subject": None,
-            "error": "Template must have YAML frontmatter with subject",
-        }
-
-    # Render subject and body with Jinja
-    try:
-        env = jinja2.Environment(autoescape=False)
-        subject_template = env.from_string(frontmatter.get("subject", ""))
-        body_jinja = env.from_string(body_template)
-
-        subject = subject_template.render(**ctx)
-        body = body_jinja.render(**ctx)
-    except jinja2.TemplateError as e:
+    compiled, error = _compile_template_file(template_path)
+    if error:
         return {
             "sent": False,
             "to": to,
             "subject": None,
-            "error": f"Template rendering error: {e}",
+            "error": error,
         }
 
-    # Determine if HTML based on frontmatter or file extension
-    is_html = frontmatter.get("html", template_path.suffix == ".html")
-
-    # Send via provider
-    result = _send_via_provider(provider, account, [to], subject, body, is_html)
-    # Preserve return shape: to is a string, not a list
-    return {
-        "sent": result["sent"],
-        "to": to,
-        "subject": result["subject"],
-        "error": result["error"],
-    }
+    return _render_and_send(account, to, template_path, compiled, context or {}, provider)
 
 
 def batch_send(
@@ -214,11 +476,14 @@ def batch_send(
     email_field: str = "email",
     dry_run: Union[bool, str] = False,
     provider: str = "msgraph",
+    max_workers: Union[int, str] = BATCH_SEND_WORKERS,
+    graph_batch: Union[bool, str] = False,
 ) -> Dict[str, Any]:
     """Send templated emails to multiple recipients.
 
     Reads: template file, recipients_file (JSON)
-    External: msgraph.send_mail or gmail.send_message (per recipient)
+    External: msgraph.send_mail or gmail.send_message (per recipient,
+              up to max_workers concurrently)
     Behavior: Continues on individual failures, reports all errors
 
     Args:
@@ -228,11 +493,16 @@ def batch_send(
         email_field: Field name containing email address (default: "email")
         dry_run: If True, render but don't send (default: False)
         provider: "msgraph" (default) or "gmail"
+        max_workers: Maximum concurrent sends (default: BATCH_SEND_WORKERS)
+        graph_batch: With msgraph, send up to GRAPH_BATCH_SIZE messages per
+            Graph $batch request instead of one request each (default: False)
 
     Returns:
         {sent: int, failed: int, errors: list, dry_run: bool, recipients: list}
     """
     dry_run = _to_bool(dry_run)
+    max_workers = max(1, int(max_workers))
+    graph_batch = _to_bool(graph_batch) and provider == "msgraph"
     template_path = Path(template).expanduser()
     recipients_path = Path(recipients_file).expanduser()
 
@@ -254,17 +524,18 @@ def batch_send(
             "recipients": [],
         }
 
-    # Load recipients
+    # Check the whole file before sending anything, so a truncated or malformed
+    # file fails without mailing the recipients ahead of the bad spot
     try:
-        recipients = json.loads(recipients_path.read_text())
-        if not isinstance(recipients, list):
-            return {
-                "sent": 0,
-                "failed": 0,
-                "errors": ["Recipients file must contain a JSON array"],
-                "dry_run": dry_run,
-                "recipients": [],
-            }
+        _check_json_array(recipients_path)
+    except _NotJSONArrayError:
+        return {
+            "sent": 0,
+            "failed": 0,
+            "errors": ["Recipients file must contain a JSON array"],
+            "dry_run": dry_run,
+            "recipients": [],
+        }
     except json.JSONDecodeError as e:
         return {
             "sent": 0,
@@ -279,35 +550,85 @@ def batch_send(
     errors: List[str] = []
     processed: List[Dict[str, Any]] = []
 
-    for recipient in recipients:
-        email = recipient.get(email_field)
-        if not email:
-            errors.append(f"Missing {email_field} field in recipient: {recipient}")
-            failed_count += 1
-            continue
-
-        if dry_run:
-            # Just record what would be sent
-            processed.append({"email": email, "status": "would_send"})
-            sent_count += 1
-            continue
-
-        # Send using send_templated
-        result = send_templated(
-            account=account,
-            to=email,
-            template=template,
-            context=recipient,
-            provider=provider,
-        )
-
-        if result["sent"]:
-            sent_count += 1
-            processed.append({"email": email, "status": "sent", "subject": result["subject"]})
-        else:
-            failed_count += 1
-            errors.append(f"{email}: {result['error']}")
-            processed.append({"email": email, "status": "failed", "error": result["error"]})
+    # Compile the template once for the whole batch (dry runs don't render)
+    compiled, template_error = None, None
+    if not dry_run:
+        compiled, template_error = _compile_template_file(template_path)
+
+    # Sends run on a thread pool; outcomes are recorded in recipient order.
+    # Each entry is (email, recipient, future) with future None for dry runs.
+    pending: Deque[Tuple[Optional[str], Dict[str, Any], Optional[Future]]] = deque()
+    # With graph_batch, recipients collected for the next $batch request and
+    # the number of recipients allowed in flight (a batch counts as one send)
+    batch: List[Tuple[str, Dict[str, Any], Future]] = []
+    window = 2 * max_workers * (GRAPH_BATCH_SIZE if graph_batch else 1)
+
+    def drain(limit: int) -> None:
+        nonlocal sent_count, failed_count
+        while len(pending) > limit:
+            # Entries from the open batch have no request yet; wait for more
+            if batch and pending[0][2] is batch[0][2]:
+                break
+            email, recipient, future = pending.popleft()
+            if not email:
+                errors.append(f"Missing {email_field} field in recipient: {recipient}")
+                failed_count += 1
+            elif future is None:
+                # Just record what would be sent
+                processed.append({"email": email, "status": "would_send"})
+                sent_count += 1
+            else:
+                result = future.result()
+                if result["sent"]:
+                    sent_count += 1
+                    processed.append(
+                        {"email": email, "status": "sent", "subject": result["subject"]}
+                    )
+                else:
+                    failed_count += 1
+                    errors.append(f"{email}: {result['error']}")
+                    processed.append(
+                        {"email": email, "status": "failed", "error": result["error"]}
+                    )
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+
+        def submit_batch() -> None:
+            if batch:
+                pool.submit(
+                    _render_and_send_graph_batch, account, template_path, compiled, batch.copy()
+                )
+                batch.clear()
+
+        # Stream recipients so only a window of them is held in memory
+        with open(recipients_path) as fh:
+            for recipient in _iter_json_array(fh):
+                email = recipient.get(email_field)
+                future = None
+                if email and not dry_run:
+                    if template_error:
+                        future = Future()
+                        future.set_result({"sent": False, "error": template_error})
+                    elif graph_batch:
+                        future = Future()
+                        batch.append((email, recipient, future))
+                        if len(batch) == GRAPH_BATCH_SIZE:
+                            submit_batch()
+                    else:
+                        future = pool.submit(
+                            _render_and_send,
+                            account,
+                            email,
+                            template_path,
+                            compiled,
+                            recipient,
+                            provider,
+                        )
+                pending.append((email, recipient, future))
+                # Bound the number of recipients held in memory
+                drain(window)
+        submit_batch()
+        drain(0)
 
     return {
         "sent": sent_count,
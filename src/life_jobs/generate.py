@@ -24,6 +24,8 @@ import uuid
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional
 
+from life_jobs._output import load_records
+
 # Import guard: llm is an optional dependency
 _LLM_AVAILABLE = False
 try:
@@ -337,7 +339,7 @@ def batch(
     """Process JSON array through LLM, optionally accumulating results.
 
     Args:
-        items_file: Path to JSON array file
+        items_file: Path to JSON array file (or .msgpack written by a prior step)
         prompt: Template prompt (can include {item} placeholder for JSON item)
         output: Path to write results JSON array
         context_files: Additional context files for each prompt
@@ -372,7 +374,7 @@ def batch(
 
     # Load and filter items
     items_path = _expand_path(items_file)
-    items: List[Dict[str, Any]] = json.loads(items_path.read_text())
+    items: List[Dict[str, Any]] = load_records(items_path)
 
     filtered_items = []
     for item in items:
@@ -17,12 +17,14 @@ __io__ = {
     "external": ["msgraph.get", "msgraph.post"],
 }
 
-import json
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from morch import GraphClient
 
+from life_jobs._clients import cached_client
+from life_jobs._output import write_records
+
 
 def get_messages(
     account: str,
@@ -35,7 +37,7 @@ def get_messages(
 
     Args:
         account: authctl account name for authentication
-        output: Path to write JSON results
+        output: Path to write results (JSON, or MessagePack for .msgpack)
         top: Maximum number of messages (default: 50)
         select: List of fields to select
         filter: OData filter expression
@@ -43,7 +45,7 @@ def get_messages(
     Returns:
         Dict with message count and output path
     """
-    client = GraphClient.from_authctl(account, scopes=["Mail.Read"])
+    client = cached_client(GraphClient, account, ("Mail.Read",))
 
     params: Dict[str, str] = {"$top": str(top)}
     if select:
@@ -54,10 +56,9 @@ def get_messages(
     messages = client.get_all("/me/messages", params=params)
 
     output_path = Path(output).expanduser()
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(json.dumps(messages, indent=2, default=str))
+    count = write_records(output_path, messages)
 
-    return {"messages": len(messages), "output": str(output_path)}
+    return {"messages": count, "output": str(output_path)}
 
 
 def send_mail(
@@ -81,7 +82,7 @@ def send_mail(
     Returns:
         Dict confirming send with recipients and subject
     """
-    client = GraphClient.from_authctl(account, scopes=["Mail.Send"])
+    client = cached_client(GraphClient, account, ("Mail.Send",))
 
     # Build body
     if body_file:
@@ -109,7 +110,7 @@ def me(account: str) -> Dict[str, Any]:
     Returns:
         User profile dict
     """
-    client = GraphClient.from_authctl(account, scopes=["User.Read"])
+    client = cached_client(GraphClient, account, ("User.Read",))
     return client.me()
 
 
@@ -124,7 +125,7 @@ def get_calendar_events(
 
     Args:
         account: authctl account name for authentication
-        output: Path to write JSON results
+        output: Path to write results (JSON, or MessagePack for .msgpack)
         top: Maximum number of events (default: 50)
         select: List of fields to select
         filter: OData filter expression
@@ -132,7 +133,7 @@ def get_calendar_events(
     Returns:
         Dict with event count and output path
     """
-    client = GraphClient.from_authctl(account, scopes=["Calendars.Read"])
+    client = cached_client(GraphClient, account, ("Calendars.Read",))
 
     params: Dict[str, str] = {"$top": str(top)}
     if select:
@@ -143,10 +144,9 @@ def get_calendar_events(
     events = client.get_all("/me/events", params=params)
 
     output_path = Path(output).expanduser()
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(json.dumps(events, indent=2, default=str))
+    count = write_records(output_path, events)
 
-    return {"events": len(events), "output": str(output_path)}
+    return {"events": count, "output": str(output_path)}
 
 
 def get_files(
@@ -159,14 +159,14 @@ def get_files(
 
     Args:
         account: authctl account name for authentication
-        output: Path to write JSON results
+        output: Path to write results (JSON, or MessagePack for .msgpack)
         folder_path: OneDrive folder path (default: root)
         top: Maximum number of files (default: 100)
 
     Returns:
         Dict with file count and output path
     """
-    client = GraphClient.from_authctl(account, scopes=["Files.Read"])
+    client = cached_client(GraphClient, account, ("Files.Read",))
 
     if folder_path:
         endpoint = f"/me/drive/root:/{folder_path}:/children"
@@ -177,7 +177,6 @@ def get_files(
     files = client.get_all(endpoint, params=params)
 
     output_path = Path(output).expanduser()
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(json.dumps(files, indent=2, default=str))
+    count = write_records(output_path, files)
 
-    return {"files": len(files), "output": str(output_path)}
+    return {"files": count, "output": str(output_path)}
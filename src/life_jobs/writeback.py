@@ -39,6 +39,8 @@ from typing import Any
 import yaml
 from morch import DataverseClient
 
+from life_jobs._clients import cached_client
+
 # Epsilon for time comparison (covers filesystem resolution + processing latency)
 EPSILON = 2.0
 
@@ -275,7 +277,7 @@ def apply_writeback(
         }
 
     # Create client once for all operations
-    client = DataverseClient.from_authctl(account)
+    client = cached_client(DataverseClient, account)
 
     succeeded = 0
     failed = 0
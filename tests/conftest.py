@@ -88,3 +88,11 @@ def sample_state() -> Dict[str, Any]:
             "last_run": "2024-11-10T09:00:00Z",
         },
     }
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path_factory, monkeypatch):
+    """Keep parse caches out of the real ~/.cache during tests."""
+    cache_dir = tmp_path_factory.mktemp("life-cache")
+    monkeypatch.setenv("LIFE_CACHE_DIR", str(cache_dir))
+    return cache_dir
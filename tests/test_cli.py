@@ -0,0 +1,115 @@
+# Copyright 2025 Ben Mensi
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for the root CLI app."""
+
+import subprocess
+import sys
+
+import pytest
+from typer.testing import CliRunner
+
+from life import __version__
+from life.cli import app
+from life.commands import SUBCOMMANDS
+
+runner = CliRunner()
+
+
+def _loaded_modules_after(*args: str) -> set:
+    """Invoke the CLI in a fresh interpreter and return loaded life.* modules."""
+    code = (
+        "import sys\n"
+        "from typer.testing import CliRunner\n"
+        "from life.cli import app\n"
+        f"CliRunner().invoke(app, {list(args)!r})\n"
+        "print('\\n'.join(m for m in sys.modules if m.startswith('life')))\n"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+    return set(out.split())
+
+
+class TestLazySubcommands:
+    """Subcommand modules are imported only when invoked."""
+
+    def test_help_lists_all_subcommands(self):
+        result = runner.invoke(app, ["--help"])
+        assert result.exit_code == 0
+        for name in SUBCOMMANDS:
+            assert name in result.stdout
+
+    def test_version_imports_no_subcommands(self):
+        loaded = _loaded_modules_after("version")
+        assert not loaded & {module for module, _ in SUBCOMMANDS.values()}
+        assert "life.config" not in loaded
+
+    def test_subcommand_imports_only_its_module(self):
+        loaded = _loaded_modules_after("jobs", "list")
+        assert "life.commands.jobs" in loaded
+        assert "life.commands.email" not in loaded
+        assert "life.commands.pipeline" not in loaded
+
+    @pytest.mark.parametrize("name", ["jobs", "pipeline", "run", "today"])
+    def test_subcommand_help_skips_job_runner(self, name):
+        loaded = _loaded_modules_after(name, "--help")
+        assert f"life.commands.{name}" in loaded
+        assert "life.job_runner" not in loaded
+        assert "life_jobs.pipeline" not in loaded
+
+
+class TestVersion:
+    """The version command."""
+
+    def test_version_output(self):
+        result = runner.invoke(app, ["version"])
+        assert result.exit_code == 0
+        assert result.stdout == f"life version {__version__}\n"
+
+
+class TestMainCallback:
+    """Config loading in the root callback."""
+
+    def test_invalid_yaml_exits_with_error(self, tmp_path):
+        config_file = tmp_path / "life.yml"
+        config_file.write_text("{ invalid yaml content: [")
+
+        result = runner.invoke(app, ["--config", str(config_file), "config", "validate"])
+        assert result.exit_code == 1
+        assert "Error parsing config file" in result.output
+
+
+class TestLauncher:
+    """Fast paths answered without importing Typer."""
+
+    def _run(self, monkeypatch, capsys, *args):
+        from life import launcher
+
+        monkeypatch.setattr(sys, "argv", ["life", *args])
+        with pytest.raises(SystemExit) as exc:
+            launcher.main()
+        return exc.value.code, capsys.readouterr().out
+
+    def test_version(self, monkeypatch, capsys):
+        code, out = self._run(monkeypatch, capsys, "version")
+        assert code == 0
+        assert out == f"life version {__version__}\n"
+
+    def test_help_lists_all_subcommands(self, monkeypatch, capsys):
+        code, out = self._run(monkeypatch, capsys, "--help")
+        assert code == 0
+        for name in ["version", *SUBCOMMANDS]:
+            assert f"  {name} " in out
+
+    def test_no_args_shows_help(self, monkeypatch, capsys):
+        code, out = self._run(monkeypatch, capsys)
+        assert code == 2
+        assert out.startswith("Usage: life")
+
+    def test_registry_help_matches_modules(self):
+        import importlib
+
+        for module_path, help_text in SUBCOMMANDS.values():
+            module = importlib.import_module(module_path)
+            assert module.app.info.help == help_text
@@ -8,7 +8,7 @@ from pathlib import Path
 import pytest
 import yaml
 
-from life.config import get_workspace, load_config
+from life.config import ConfigParseError, get_workspace, load_config
 from life.runner import expand_path
 
 
@@ -39,6 +39,8 @@ class TestLoadConfig:
 
         with pytest.raises(yaml.YAMLError, match="Error parsing config file"):
             load_config(str(invalid_yaml))
+        with pytest.raises(ConfigParseError):
+            load_config(str(invalid_yaml))
 
     def test_load_config_empty_file(self, temp_dir):
         """Test loading empty config file returns empty dict."""
@@ -60,6 +62,53 @@ class TestLoadConfig:
         assert config["workspace"] == str(Path.home() / "my-workspace")
 
 
+class TestConfigCache:
+    """Test the on-disk parse cache used by load_config."""
+
+    def test_second_load_skips_yaml_parse(self, config_file, monkeypatch):
+        """Unchanged config is served from the cache without parsing YAML."""
+        first = load_config(str(config_file))
+
+        def fail(*args, **kwargs):
+            raise AssertionError("YAML should not be parsed on cache hit")
+
+        monkeypatch.setattr(yaml, "load", fail)
+        assert load_config(str(config_file)) == first
+
+    def test_cached_load_reports_issues_without_revalidating(
+        self, temp_dir, monkeypatch, caplog
+    ):
+        """Validation warnings are replayed from the cache on a hit."""
+        config_path = temp_dir / "life.yml"
+        config_path.write_text("bogus_key: 1\n")
+        load_config(str(config_path))
+
+        def fail(*args, **kwargs):
+            raise AssertionError("Config should not be revalidated on cache hit")
+
+        monkeypatch.setattr("life.config.validate_config", fail)
+        caplog.clear()
+        load_config(str(config_path))
+        assert "Unknown top-level config keys: bogus_key" in caplog.text
+
+    def test_modified_file_invalidates_cache(self, temp_dir):
+        """Editing the config file causes a re-parse."""
+        config_path = temp_dir / "life.yml"
+        config_path.write_text("workspace: ~/one\n")
+        assert load_config(str(config_path))["workspace"].endswith("one")
+
+        config_path.write_text("workspace: ~/two-two\n")
+        assert load_config(str(config_path))["workspace"].endswith("two-two")
+
+    def test_corrupt_cache_is_ignored(self, config_file, isolated_cache_dir):
+        """A corrupt cache file falls back to parsing YAML."""
+        expected = load_config(str(config_file))
+        for cache_file in isolated_cache_dir.iterdir():
+            cache_file.write_bytes(b"not a pickle")
+
+        assert load_config(str(config_file)) == expected
+
+
 class TestGetWorkspace:
     """Test workspace path resolution."""
 
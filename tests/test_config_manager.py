@@ -3,6 +3,7 @@
 
 """Tests for config_manager.py module."""
 
+from unittest.mock import patch
 
 from life.config_manager import (
     extract_tools_from_command,
@@ -19,32 +20,32 @@ class TestExtractToolsFromCommand:
     def test_simple_command(self):
         """Test extracting tool from simple command."""
         tools = extract_tools_from_command("msg sync")
-        assert tools == ["msg"]
+        assert tools == ("msg",)
 
     def test_command_with_path(self):
         """Test extracting tool from command with path."""
         tools = extract_tools_from_command("/usr/bin/msg sync")
-        assert tools == ["msg"]
+        assert tools == ("msg",)
 
     def test_command_with_sudo(self):
         """Test extracting tool from command with sudo."""
         tools = extract_tools_from_command("sudo msg sync")
-        assert tools == ["msg"]
+        assert tools == ("msg",)
 
     def test_command_with_env(self):
         """Test extracting tool from command with env."""
         tools = extract_tools_from_command("env VAR=value msg sync")
-        assert tools == ["msg"]
+        assert tools == ("msg",)
 
     def test_empty_command(self):
         """Test extracting from empty command."""
         tools = extract_tools_from_command("")
-        assert tools == []
+        assert tools == ()
 
     def test_command_with_variables(self):
         """Test extracting tool from command with variables."""
         tools = extract_tools_from_command("gws sheets export {sheet_id} {output}")
-        assert tools == ["gws"]
+        assert tools == ("gws",)
 
 
 class TestExtractToolsFromConfig:
@@ -218,6 +219,16 @@ class TestValidateTools:
         # Message should contain either install hint or description
         assert len(message) > 0
 
+    def test_registered_tool_checks_its_binary(self):
+        """Test that a registered tool is looked up by binary, once."""
+        config = {"sync": {"test": {"command": "msg sync"}}}
+
+        with patch("life.config_manager.is_binary_on_path", return_value=False) as on_path:
+            results = validate_tools(config)
+        on_path.assert_called_once_with("msg")
+        assert results[0][1] is False
+        assert "Not installed" in results[0][2]
+
 
 class TestGetTaskSummary:
     """Test task summary generation."""
@@ -365,3 +376,18 @@ class TestFullValidation:
         if tool_results:
             assert isinstance(tool_results[0], tuple)
             assert len(tool_results[0]) == 3
+
+    def test_full_validation_reuses_load_config_issues(self, tmp_path, monkeypatch):
+        """Test that a loaded config is not structurally validated twice."""
+        from life.config import load_config
+
+        config_path = tmp_path / "life.yml"
+        config_path.write_text("bogus_key: 1\n")
+        config = load_config(str(config_path))
+
+        def fail(*args, **kwargs):
+            raise AssertionError("Loaded config should not be revalidated")
+
+        monkeypatch.setattr("life.config.validate_config", fail)
+        structure_issues, _ = full_validation(config)
+        assert any("bogus_key" in issue for issue in structure_issues)
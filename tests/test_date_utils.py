@@ -3,7 +3,7 @@
 
 """Tests for date_utils.py module."""
 
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 
 import pytest
 
@@ -82,6 +82,22 @@ class TestParseDateRange:
             expected_from = (datetime.now().date() - timedelta(days=days)).isoformat()
             assert from_date == expected_from
 
+    def test_range_follows_current_date(self, monkeypatch):
+        """Test that memoized ranges are recomputed when the day changes."""
+
+        class FakeDate(date):
+            current = date(2024, 11, 10)
+
+            @classmethod
+            def today(cls):
+                return cls.current
+
+        monkeypatch.setattr("life.date_utils.date", FakeDate)
+        assert parse_date_range("7d") == ("2024-11-03", "2024-11-10")
+
+        FakeDate.current = date(2024, 11, 11)
+        assert parse_date_range("7d") == ("2024-11-04", "2024-11-11")
+
 
 class TestGetDateVariables:
     """Test date variables dictionary generation."""
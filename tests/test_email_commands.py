@@ -3,13 +3,20 @@
 Tests the _resolve_template_path() function which resolves template names
 to full paths in the command layer (before passing to processors).
 
-Also tests _get_provider_for_account() for provider selection logic.
+Also tests _get_provider_for_account() for provider selection logic,
+and error reporting in the send command.
 """
 
 from pathlib import Path
+from unittest.mock import patch
 
+from typer.testing import CliRunner
+
+from life.cli import app
 from life.commands.email import _get_provider_for_account, _resolve_template_path
 
+runner = CliRunner()
+
 
 class TestResolveTemplatePath:
     """Tests for _resolve_template_path()."""
@@ -90,6 +97,16 @@ class TestResolveTemplatePath:
 
         assert result == str(tmp_path / "reminder.html")
 
+    def test_new_template_seen_after_directory_changes(self, tmp_path):
+        """Cached directory listing is refreshed when a template is added."""
+        config = {"email": {"templates_dir": str(tmp_path)}}
+        assert _resolve_template_path("reminder", config) == str(tmp_path / "reminder.md")
+
+        (tmp_path / "reminder.html").write_text("html content")
+        result = _resolve_template_path("reminder", config)
+
+        assert result == str(tmp_path / "reminder.html")
+
     def test_defaults_to_md_when_neither_exists(self, tmp_path):
         """When neither .md nor .html exists, default to .md path."""
         config = {"email": {"templates_dir": str(tmp_path)}}
@@ -159,3 +176,101 @@ class TestGetProviderForAccount:
         config = {"email": {"gmail_accounts": [], "msgraph_accounts": []}}
         result = _get_provider_for_account("any-account", config)
         assert result == "msgraph"
+
+    def test_load_config_leaves_email_section_unchanged(self, tmp_path):
+        """Provider lookup works on load_config output without extra keys."""
+        from life.config import load_config
+
+        config_path = tmp_path / "life.yml"
+        config_path.write_text(
+            "email:\n"
+            "  gmail_accounts: [my-gmail]\n"
+            "  msgraph_accounts: [my-office]\n"
+        )
+        config = load_config(str(config_path))
+
+        assert config["email"] == {
+            "gmail_accounts": ["my-gmail"],
+            "msgraph_accounts": ["my-office"],
+        }
+        assert _get_provider_for_account("my-gmail", config) == "gmail"
+        assert _get_provider_for_account("my-office", config) == "msgraph"
+
+
+class TestSendErrors:
+    """Tests for error reporting in the send command."""
+
+    _ARGS = ["email", "send", "user@example.com", "-a", "acct", "-s", "Hi", "-b", "Body"]
+
+    def test_step_error_reported_once(self):
+        """A failed send prints its error without a stray generic one."""
+        step = {"to": ["user@example.com"], "subject": None, "error": "boom"}
+        with patch("life.commands.email.run_job", return_value={"steps": [{"result": step}]}):
+            result = runner.invoke(app, self._ARGS)
+
+        assert result.exit_code == 1
+        assert result.stderr == "Error: boom\n"
+        assert result.stdout == ""
+
+    def test_run_job_exception_reported(self):
+        """Exceptions from run_job are reported and exit 1."""
+        with patch("life.commands.email.run_job", side_effect=KeyError("Job not found")):
+            result = runner.invoke(app, self._ARGS)
+
+        assert result.exit_code == 1
+        assert "Error: 'Job not found'" in result.output
+
+    def test_missing_template_fails_before_run_job(self, tmp_path):
+        """A template that doesn't exist is reported without running the job."""
+        missing = str(tmp_path / "missing.md")
+        with patch("life.commands.email.run_job") as mock_run_job:
+            result = runner.invoke(
+                app, ["email", "send", "user@example.com", "-a", "acct", "-t", missing]
+            )
+
+        assert result.exit_code == 1
+        assert f"Template not found: {missing}" in result.stderr
+        mock_run_job.assert_not_called()
+
+
+class TestBatchPaths:
+    """Tests for path handling in the batch command."""
+
+    def test_batch_passes_resolved_paths(self, tmp_path, monkeypatch):
+        """Batch resolves template and recipients to absolute paths."""
+        (tmp_path / "t.md").write_text("---\nsubject: Hi\n---\nBody")
+        (tmp_path / "r.json").write_text("[]")
+        monkeypatch.chdir(tmp_path)
+
+        step = {"sent": 0, "failed": 0, "errors": [], "dry_run": False, "recipients": []}
+        with patch(
+            "life.commands.email.run_job", return_value={"steps": [{"result": step}]}
+        ) as mock_run_job:
+            result = runner.invoke(app, ["email", "batch", "./t.md", "r.json", "-a", "acct"])
+
+        assert result.exit_code == 0
+        variables = mock_run_job.call_args.kwargs["variables"]
+        assert variables["template"] == str((tmp_path / "t.md").resolve())
+        assert variables["recipients_file"] == str((tmp_path / "r.json").resolve())
+
+    def test_batch_passes_send_options(self, tmp_path):
+        """Batch passes --max-workers and --graph-batch through as job variables."""
+        (tmp_path / "t.md").write_text("---\nsubject: Hi\n---\nBody")
+        (tmp_path / "r.json").write_text("[]")
+
+        step = {"sent": 0, "failed": 0, "errors": [], "dry_run": False, "recipients": []}
+        with patch(
+            "life.commands.email.run_job", return_value={"steps": [{"result": step}]}
+        ) as mock_run_job:
+            result = runner.invoke(
+                app,
+                [
+                    "email", "batch", str(tmp_path / "t.md"), str(tmp_path / "r.json"),
+                    "-a", "acct", "--max-workers", "3", "--graph-batch",
+                ],
+            )
+
+        assert result.exit_code == 0
+        variables = mock_run_job.call_args.kwargs["variables"]
+        assert variables["max_workers"] == 3
+        assert variables["graph_batch"] is True
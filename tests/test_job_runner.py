@@ -5,6 +5,9 @@ Licensed under the Apache License, Version 2.0
 """
 
 import json
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import patch
 
 import pytest
 
@@ -13,11 +16,12 @@ from life.job_runner import (
     InvalidJobNameError,
     JobLoadError,
     UnsubstitutedVariableError,
-    _check_unsubstituted,
+    _resolve_module,
     _substitute_variables,
     get_job,
     list_jobs,
     load_jobs,
+    load_jobs_cached,
     resolve_callable,
     run_job,
     validate_job_name,
@@ -45,18 +49,30 @@ class TestResolveCallable:
         with pytest.raises(CallNotAllowedError):
             resolve_callable("subprocess.run")
 
+    def test_resolve_callable_imports_once(self):
+        """Should import each allowed module once but look up the function each time."""
+        module = SimpleNamespace(run=lambda: None)
+
+        _resolve_module.cache_clear()
+        with patch("life.job_runner.importlib.import_module", return_value=module) as imp:
+            assert resolve_callable("life_jobs.demo.run") is module.run
+            module.run = replacement = lambda: None
+            assert resolve_callable("life_jobs.demo.run") is replacement
+        assert imp.call_count == 1
+        _resolve_module.cache_clear()
+
 
 class TestSubstituteVariables:
     """Tests for _substitute_variables function."""
 
     def test_simple_string(self):
         """Should substitute in simple strings."""
-        result = _substitute_variables("Hello {name}!", {"name": "World"})
+        result, _ = _substitute_variables("Hello {name}!", {"name": "World"})
         assert result == "Hello World!"
 
     def test_dict_values(self):
         """Should substitute in dict values."""
-        result = _substitute_variables(
+        result, _ = _substitute_variables(
             {"greeting": "Hello {name}!", "path": "{dir}/file.txt"},
             {"name": "User", "dir": "/home"},
         )
@@ -64,7 +80,7 @@ class TestSubstituteVariables:
 
     def test_list_values(self):
         """Should substitute in list items."""
-        result = _substitute_variables(
+        result, _ = _substitute_variables(
             ["{a}", "{b}", "literal"],
             {"a": "first", "b": "second"},
         )
@@ -72,7 +88,7 @@ class TestSubstituteVariables:
 
     def test_nested_structures(self):
         """Should handle nested dicts and lists."""
-        result = _substitute_variables(
+        result, _ = _substitute_variables(
             {"outer": {"inner": ["{val}"]}},
             {"val": "nested"},
         )
@@ -80,41 +96,63 @@ class TestSubstituteVariables:
 
     def test_non_string_values_unchanged(self):
         """Should leave non-string values unchanged."""
-        result = _substitute_variables(
+        result, _ = _substitute_variables(
             {"num": 42, "bool": True, "none": None},
             {"anything": "value"},
         )
         assert result == {"num": 42, "bool": True, "none": None}
 
+    def test_whole_placeholder_keeps_type(self):
+        """Should pass typed values through when the arg is exactly {var}."""
+        result, _ = _substitute_variables(
+            {"flag": "{dry_run}", "label": "dry_run={dry_run}"},
+            {"dry_run": True},
+        )
+        assert result == {"flag": True, "label": "dry_run=true"}
+
+    def test_values_are_not_resubstituted(self):
+        """Should not expand placeholders that appear inside substituted values."""
+        result, _ = _substitute_variables(
+            "{a} {b} {{b}}",
+            {"a": "{b}", "b": "two"},
+        )
+        assert result == "{b} two {two}"
+
+    def test_deep_nesting_and_input_unchanged(self):
+        """Should handle nesting deeper than the recursion limit without mutating input."""
+        args = {"v": ["{x}"]}
+        for _ in range(5000):
+            args = {"child": args}
+        result, unsubstituted = _substitute_variables(args, {"x": "ok"})
+
+        assert unsubstituted == set()
+        while "child" in result:
+            result, args = result["child"], args["child"]
+        assert result == {"v": ["ok"]}
+        assert args == {"v": ["{x}"]}
+
     def test_missing_variable_leaves_placeholder(self):
-        """Missing variables leave placeholder (caught by _check_unsubstituted)."""
-        result = _substitute_variables("Hello {missing}!", {})
+        """Missing variables leave placeholder and are reported."""
+        result, unsubstituted = _substitute_variables("Hello {missing}!", {})
         assert result == "Hello {missing}!"
+        assert unsubstituted == {"missing"}
 
 
-class TestCheckUnsubstituted:
-    """Tests for _check_unsubstituted function."""
+class TestUnsubstitutedCollection:
+    """Tests for placeholders reported by _substitute_variables."""
 
     def test_no_placeholders_ok(self):
-        """Should pass when no placeholders remain."""
-        _check_unsubstituted("Hello World!", "test_step")  # No exception
-
-    def test_remaining_placeholder_raises(self):
-        """Should raise when placeholders remain."""
-        with pytest.raises(UnsubstitutedVariableError) as exc_info:
-            _check_unsubstituted("Hello {name}!", "test_step")
-        assert "name" in str(exc_info.value)
-        assert "test_step" in str(exc_info.value)
+        """Should report nothing when no placeholders remain."""
+        _, unsubstituted = _substitute_variables("Hello {name}!", {"name": "World"})
+        assert unsubstituted == set()
 
     def test_multiple_unsubstituted(self):
-        """Should report all unsubstituted variables."""
-        with pytest.raises(UnsubstitutedVariableError) as exc_info:
-            _check_unsubstituted(
-                {"a": "{foo}", "b": "{bar}"},
-                "test_step",
-            )
-        assert "foo" in str(exc_info.value)
-        assert "bar" in str(exc_info.value)
+        """Should report all unsubstituted variables across the tree."""
+        _, unsubstituted = _substitute_variables(
+            {"a": "{foo}", "b": ["x {bar}", "{known}"]},
+            {"known": "ok"},
+        )
+        assert unsubstituted == {"foo", "bar"}
 
 
 class TestLoadJobs:
@@ -192,6 +230,65 @@ jobs:
             load_jobs(tmp_path)
         assert len(exc_info.value.errors) == 2
 
+    def test_parallel_load_merges_in_filename_order(self, tmp_path):
+        """Should merge many files in sorted order, later files overriding earlier."""
+        for i in range(6):
+            (tmp_path / f"f{i}.yaml").write_text(
+                f"jobs:\n  shared:\n    description: 'from {i}'\n  job_{i}:\n    steps: []\n"
+            )
+        (tmp_path / "f3.yaml").write_text("invalid: [")
+
+        with pytest.raises(JobLoadError) as exc_info:
+            load_jobs(tmp_path)
+        assert [path.name for path, _ in exc_info.value.errors] == ["f3.yaml"]
+
+        (tmp_path / "f3.yaml").write_text("jobs: {}\n")
+        jobs = load_jobs(tmp_path)
+        assert jobs["shared"]["description"] == "from 5"
+        assert set(jobs) == {"shared", "job_0", "job_1", "job_2", "job_4", "job_5"}
+
+
+class TestLoadJobsCached:
+    """Tests for load_jobs_cached function."""
+
+    def test_cache_hit_skips_yaml_parse(self, tmp_path, monkeypatch):
+        """Should serve unchanged job files from the cache."""
+        (tmp_path / "a.yaml").write_text("jobs:\n  a.job:\n    steps: []\n")
+        first = load_jobs_cached(tmp_path)
+
+        def fail(_):
+            raise AssertionError("load_jobs called on cache hit")
+
+        monkeypatch.setattr("life.job_runner.load_jobs", fail)
+        monkeypatch.setattr("life.job_runner._JOBS_CACHE", {})  # force the on-disk cache
+        assert load_jobs_cached(tmp_path) == first == {"a.job": {"steps": []}}
+
+    def test_changed_files_invalidate_cache(self, tmp_path):
+        """Should reload when a job file is added or removed."""
+        (tmp_path / "a.yaml").write_text("jobs:\n  a.job:\n    steps: []\n")
+        load_jobs_cached(tmp_path)
+
+        (tmp_path / "b.yaml").write_text("jobs:\n  b.job:\n    steps: []\n")
+        assert set(load_jobs_cached(tmp_path)) == {"a.job", "b.job"}
+
+        (tmp_path / "a.yaml").unlink()
+        assert set(load_jobs_cached(tmp_path)) == {"b.job"}
+
+    def test_repeat_calls_skip_disk_cache(self, tmp_path, monkeypatch):
+        """Should serve repeat calls in the same process from memory."""
+        (tmp_path / "a.yaml").write_text("jobs:\n  a.job:\n    steps: []\n")
+        first = load_jobs_cached(tmp_path)
+
+        monkeypatch.setattr("life.job_runner._jobs_cache_file", None)
+        assert load_jobs_cached(tmp_path) is first
+
+    def test_yaml_error_not_cached(self, tmp_path):
+        """Should raise JobLoadError on every call for invalid YAML."""
+        (tmp_path / "bad.yaml").write_text("invalid: [")
+        for _ in range(2):
+            with pytest.raises(JobLoadError):
+                load_jobs_cached(tmp_path)
+
 
 class TestListJobs:
     """Tests for list_jobs function."""
@@ -473,6 +570,7 @@ class TestEventClient:
         event = json.loads(log_path.read_text().strip())
         assert "timestamp" in event
         assert "T" in event["timestamp"]  # ISO format
+        assert datetime.fromisoformat(event["timestamp"]).utcoffset() == timedelta(0)
 
     def test_log_event_includes_error_message(self, tmp_path):
         """Should include error_message when provided."""
@@ -486,3 +584,43 @@ class TestEventClient:
 
         event = json.loads(log_path.read_text().strip())
         assert event["error_message"] == "Something went wrong"
+
+    def test_context_manager_keeps_log_open(self, tmp_path):
+        """Should write each event immediately while holding the log open."""
+        from life.event_client import EventClient
+
+        log_path = tmp_path / "events.jsonl"
+        with EventClient(log_path) as client:
+            client.log_event("job.started", "test-123", "success", {"note": "café"})
+            assert json.loads(log_path.read_text(encoding="utf-8"))["payload"] == {
+                "note": "café"
+            }
+            client.log_event("job.completed", "test-123", "success", {})
+        assert client._fh is None
+
+        lines = log_path.read_text().strip().split("\n")
+        assert [json.loads(line)["event_type"] for line in lines] == [
+            "job.started",
+            "job.completed",
+        ]
+
+    def test_batch_written_on_flush(self, tmp_path):
+        """Should hold batched events until flushed, preserving order."""
+        from life.event_client import EventClient
+
+        log_path = tmp_path / "events.jsonl"
+        client = EventClient(log_path)
+        client.begin_batch()
+        client.log_event("job.started", "test-123", "success", {})
+        client.log_event("job.completed", "test-123", "success", {})
+        assert not log_path.exists()
+
+        client.flush_batch()
+        lines = log_path.read_text().strip().split("\n")
+        assert [json.loads(line)["event_type"] for line in lines] == [
+            "job.started",
+            "job.completed",
+        ]
+
+        client.log_event("job.failed", "test-456", "failed", {})
+        assert len(log_path.read_text().strip().split("\n")) == 3
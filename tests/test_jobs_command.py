@@ -0,0 +1,110 @@
+# Copyright 2025 Ben Mensi
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for jobs command."""
+
+from unittest.mock import patch
+
+import pytest
+from typer.testing import CliRunner
+
+from life.cli import app
+
+runner = CliRunner()
+
+
+@pytest.fixture
+def jobs_dir(tmp_path):
+    """A jobs directory with two job definitions."""
+    (tmp_path / "demo.yaml").write_text(
+        """
+jobs:
+  demo.first:
+    description: "First job"
+    steps: []
+  demo.second:
+    steps: []
+"""
+    )
+    with patch("life.commands.jobs.get_jobs_dir", return_value=tmp_path):
+        yield tmp_path
+
+
+class TestJobsList:
+    """Test jobs list command."""
+
+    def test_list_output(self, jobs_dir):
+        """Test listing jobs with and without descriptions."""
+        result = runner.invoke(app, ["jobs", "list"])
+        assert result.exit_code == 0
+        assert result.stdout == (
+            "Available jobs:\n\n"
+            "  demo.first\n    First job\n\n"
+            "  demo.second\n    (no description)\n\n"
+        )
+
+
+class TestJobsShow:
+    """Test jobs show command."""
+
+    def test_show_prints_source_with_comments(self, jobs_dir):
+        """Test that the job's YAML is shown as written."""
+        (jobs_dir / "commented.yaml").write_text(
+            "jobs:\n"
+            "  demo.commented:\n"
+            "    # Explains the step\n"
+            "    steps:\n"
+            "      - name: one\n"
+            "        call: life_jobs.shell.run\n"
+            "\n"
+            "  demo.other:\n"
+            "    steps: []\n"
+        )
+
+        result = runner.invoke(app, ["jobs", "show", "demo.commented"])
+        assert result.exit_code == 0
+        assert result.stdout == (
+            "Job: demo.commented\n\n"
+            "demo.commented:\n"
+            "  # Explains the step\n"
+            "  steps:\n"
+            "    - name: one\n"
+            "      call: life_jobs.shell.run\n\n"
+        )
+
+    def test_show_falls_back_to_dump(self, jobs_dir):
+        """Test that jobs with unlocatable source are re-emitted."""
+        (jobs_dir / "flow.yaml").write_text('{jobs: {"demo.flow": {steps: []}}}\n')
+
+        result = runner.invoke(app, ["jobs", "show", "demo.flow"])
+        assert result.exit_code == 0
+        assert "demo.flow:\n  steps: []\n" in result.stdout
+
+    def test_show_ignores_nested_keys_with_job_name(self, jobs_dir):
+        """Test that a nested key named like the job doesn't shadow the job itself."""
+        (jobs_dir / "notify.yaml").write_text(
+            "jobs:\n"
+            "  demo.notify:\n"
+            "    steps: []\n"
+        )
+        # Sorts after notify.yaml, so it is scanned first
+        (jobs_dir / "zz.yaml").write_text(
+            "jobs:\n"
+            "  demo.caller:\n"
+            "    steps:\n"
+            "      - name: one\n"
+            "        call: life_jobs.shell.run\n"
+            "        args:\n"
+            "          demo.notify:\n"
+            "            to: someone\n"
+        )
+
+        result = runner.invoke(app, ["jobs", "show", "demo.notify"])
+        assert result.exit_code == 0
+        assert result.stdout == "Job: demo.notify\n\ndemo.notify:\n  steps: []\n\n"
+
+    def test_show_unknown_job(self, jobs_dir):
+        """Test that unknown jobs are reported."""
+        result = runner.invoke(app, ["jobs", "show", "demo.missing"])
+        assert result.exit_code == 1
+        assert "Job not found" in result.output
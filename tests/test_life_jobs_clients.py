@@ -0,0 +1,72 @@
+"""Tests for life_jobs._clients module.
+
+Copyright 2025 Ben Mensi
+Licensed under the Apache License, Version 2.0
+"""
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from life_jobs import _clients
+from life_jobs._clients import cached_client
+
+
+class TestCachedClient:
+    """Tests for cached_client function."""
+
+    def test_reuses_client_per_account_and_scopes(self):
+        """Should construct one client per (class, account, scopes)."""
+        client_cls = MagicMock()
+        client_cls.from_authctl.side_effect = lambda *args, **kwargs: object()
+
+        first = cached_client(client_cls, "work", ("Mail.Read",))
+        assert cached_client(client_cls, "work", ("Mail.Read",)) is first
+        assert cached_client(client_cls, "work", ("Mail.Send",)) is not first
+        assert cached_client(client_cls, "home", ("Mail.Read",)) is not first
+
+        client_cls.from_authctl.assert_any_call("work", scopes=["Mail.Read"])
+        assert client_cls.from_authctl.call_count == 3
+
+    def test_without_scopes(self):
+        """Should call from_authctl with just the account when no scopes are given."""
+        client_cls = MagicMock()
+
+        cached_client(client_cls, "lifeos")
+
+        client_cls.from_authctl.assert_called_once_with("lifeos")
+
+    def test_failures_are_not_cached(self):
+        """Should retry construction after a failed attempt."""
+        client_cls = MagicMock()
+        client_cls.from_authctl.side_effect = [Exception("Auth failed"), "client"]
+
+        with pytest.raises(Exception, match="Auth failed"):
+            cached_client(client_cls, "work")
+        assert cached_client(client_cls, "work") == "client"
+
+    def test_each_thread_gets_its_own_client(self):
+        """Should not share a client between threads."""
+        client_cls = MagicMock()
+        client_cls.from_authctl.side_effect = lambda *args, **kwargs: object()
+
+        main_client = cached_client(client_cls, "work")
+        other = []
+        thread = threading.Thread(target=lambda: other.append(cached_client(client_cls, "work")))
+        thread.start()
+        thread.join()
+
+        assert other[0] is not main_client
+        assert cached_client(client_cls, "work") is main_client
+
+    def test_client_is_rebuilt_after_ttl(self):
+        """Should rebuild a client once it is older than CLIENT_TTL_SECONDS."""
+        client_cls = MagicMock()
+        client_cls.from_authctl.side_effect = lambda *args, **kwargs: object()
+
+        with patch("life_jobs._clients.time.monotonic", return_value=1000.0):
+            first = cached_client(client_cls, "work")
+        later = 1000.0 + _clients.CLIENT_TTL_SECONDS
+        with patch("life_jobs._clients.time.monotonic", return_value=later):
+            assert cached_client(client_cls, "work") is not first
@@ -4,8 +4,13 @@ Copyright 2025 Ben Mensi
 Licensed under the Apache License, Version 2.0
 """
 
+import io
+import json
+import threading
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from life_jobs import email
 
 
@@ -292,16 +297,55 @@ class TestSendTemplated:
         call_args = mock_send_via_provider.call_args
         assert call_args[0][0] == "msgraph"
 
+    @patch("life_jobs.email._send_via_provider")
+    def test_send_templated_compiles_template_once(self, mock_send_via_provider, tmp_path):
+        """Should reuse the compiled template until the file changes."""
+        mock_send_via_provider.return_value = {
+            "sent": True,
+            "to": ["user@example.com"],
+            "subject": "Hi",
+            "error": None,
+        }
+
+        template = tmp_path / "template.md"
+        template.write_text("---\nsubject: Hi {{ name }}\n---\nHello {{ name }}")
+
+        with patch.object(
+            email._JINJA_ENV, "from_string", wraps=email._JINJA_ENV.from_string
+        ) as mock_from_string:
+            for name in ("Ann", "Bob"):
+                email.send_templated(
+                    account="test",
+                    to="user@example.com",
+                    template=str(template),
+                    context={"name": name},
+                )
+
+        assert mock_from_string.call_count == 2  # subject + body, compiled once
+        last_call = mock_send_via_provider.call_args[0]
+        assert last_call[3] == "Hi Bob"
+        assert last_call[4] == "Hello Bob"
+
+    def test_send_templated_missing_closing_delimiter(self, tmp_path):
+        """Should report frontmatter that is never closed."""
+        template = tmp_path / "template.md"
+        template.write_text("---\nsubject: Hi\nBody without closing")
+
+        result = email.send_templated(account="test", to="user@example.com", template=str(template))
+
+        assert result["sent"] is False
+        assert result["error"] == "Invalid template format: missing closing ---"
+
 
 class TestBatchSend:
     """Tests for batch_send() function."""
 
-    @patch("life_jobs.email.send_templated")
-    def test_batch_send_passes_provider(self, mock_send_templated, tmp_path):
-        """Should pass provider to send_templated for each recipient."""
-        mock_send_templated.return_value = {
+    @patch("life_jobs.email._send_via_provider")
+    def test_batch_send_passes_provider(self, mock_send_via_provider, tmp_path):
+        """Should pass provider to _send_via_provider for each recipient."""
+        mock_send_via_provider.return_value = {
             "sent": True,
-            "to": "user@example.com",
+            "to": ["user@example.com"],
             "subject": "Test",
             "error": None,
         }
@@ -319,16 +363,16 @@ class TestBatchSend:
             provider="gmail",
         )
 
-        assert mock_send_templated.call_count == 2
-        for call in mock_send_templated.call_args_list:
-            assert call[1]["provider"] == "gmail"
+        assert mock_send_via_provider.call_count == 2
+        for call in mock_send_via_provider.call_args_list:
+            assert call[0][0] == "gmail"
 
-    @patch("life_jobs.email.send_templated")
-    def test_batch_send_defaults_to_msgraph(self, mock_send_templated, tmp_path):
+    @patch("life_jobs.email._send_via_provider")
+    def test_batch_send_defaults_to_msgraph(self, mock_send_via_provider, tmp_path):
         """Should default to msgraph provider."""
-        mock_send_templated.return_value = {
+        mock_send_via_provider.return_value = {
             "sent": True,
-            "to": "user@example.com",
+            "to": ["user@example.com"],
             "subject": "Test",
             "error": None,
         }
@@ -345,5 +389,290 @@ class TestBatchSend:
             recipients_file=str(recipients),
         )
 
-        call_args = mock_send_templated.call_args
-        assert call_args[1]["provider"] == "msgraph"
+        call_args = mock_send_via_provider.call_args
+        assert call_args[0][0] == "msgraph"
+
+    def test_batch_send_rejects_non_array(self, tmp_path):
+        """Should report an error when recipients is not a JSON array."""
+        template = tmp_path / "template.md"
+        template.write_text("---\nsubject: Test\n---\nBody")
+
+        recipients = tmp_path / "recipients.json"
+        recipients.write_text('{"email": "user@example.com"}')
+
+        result = email.batch_send(
+            account="test",
+            template=str(template),
+            recipients_file=str(recipients),
+            dry_run=True,
+        )
+
+        assert result["sent"] == 0
+        assert result["errors"] == ["Recipients file must contain a JSON array"]
+
+    @patch("life_jobs.email._send_via_provider")
+    def test_batch_send_truncated_file_sends_nothing(self, mock_send_via_provider, tmp_path):
+        """Should report a JSON error without sending to recipients before it."""
+        template = tmp_path / "template.md"
+        template.write_text("---\nsubject: Test\n---\nBody")
+
+        recipients = tmp_path / "recipients.json"
+        recipients.write_text('[{"email": "user1@example.com"}, {"email": ')
+
+        result = email.batch_send(
+            account="test",
+            template=str(template),
+            recipients_file=str(recipients),
+        )
+
+        mock_send_via_provider.assert_not_called()
+        assert result["sent"] == 0
+        assert result["recipients"] == []
+        assert len(result["errors"]) == 1
+        assert result["errors"][0].startswith("Invalid JSON in recipients file")
+
+    @patch("life_jobs.email._send_via_provider")
+    def test_batch_send_compiles_template_once(self, mock_send_via_provider, tmp_path):
+        """Should compile the template once and render it per recipient."""
+        mock_send_via_provider.return_value = {
+            "sent": True,
+            "to": ["user@example.com"],
+            "subject": "Hi",
+            "error": None,
+        }
+
+        template = tmp_path / "template.md"
+        template.write_text("---\nsubject: Hi {{ name }}\n---\nBody")
+
+        recipients = tmp_path / "recipients.json"
+        recipients.write_text(
+            '[{"email": "a@example.com", "name": "Ann"}, {"email": "b@example.com", "name": "Bob"}]'
+        )
+
+        with patch("life_jobs.email._load_template", wraps=email._load_template) as mock_load:
+            result = email.batch_send(
+                account="test",
+                template=str(template),
+                recipients_file=str(recipients),
+            )
+
+        assert mock_load.call_count == 1
+        assert result["sent"] == 2
+        subjects = [call[0][3] for call in mock_send_via_provider.call_args_list]
+        assert subjects == ["Hi Ann", "Hi Bob"]
+
+    def test_batch_send_template_error_fails_each_recipient(self, tmp_path):
+        """Should report a bad template against every recipient."""
+        template = tmp_path / "template.md"
+        template.write_text("No frontmatter")
+
+        recipients = tmp_path / "recipients.json"
+        recipients.write_text('[{"email": "a@example.com"}, {"email": "b@example.com"}]')
+
+        result = email.batch_send(
+            account="test",
+            template=str(template),
+            recipients_file=str(recipients),
+        )
+
+        assert result["sent"] == 0
+        assert result["failed"] == 2
+        assert result["errors"] == [
+            "a@example.com: Template must have YAML frontmatter with subject",
+            "b@example.com: Template must have YAML frontmatter with subject",
+        ]
+
+    def test_batch_send_sends_concurrently_in_order(self, tmp_path):
+        """Should overlap sends while reporting recipients in file order."""
+        template = tmp_path / "template.md"
+        template.write_text("---\nsubject: Test\n---\nBody")
+
+        recipients = tmp_path / "recipients.json"
+        recipients.write_text(
+            '[{"email": "a@example.com"}, {"name": "no email"}, {"email": "b@example.com"}]'
+        )
+
+        # Both sends must be in flight at once for the barrier to release
+        barrier = threading.Barrier(2, timeout=5)
+
+        def fake_send(provider, account, to, subject, body, is_html):
+            barrier.wait()
+            return {"sent": True, "to": to, "subject": subject, "error": None}
+
+        with patch("life_jobs.email._send_via_provider", side_effect=fake_send):
+            result = email.batch_send(
+                account="test",
+                template=str(template),
+                recipients_file=str(recipients),
+            )
+
+        assert result["sent"] == 2
+        assert result["failed"] == 1
+        assert [r["email"] for r in result["recipients"]] == ["a@example.com", "b@example.com"]
+        assert result["errors"][0].startswith("Missing email field")
+
+    def test_batch_send_max_workers(self, tmp_path):
+        """Should size the send pool from max_workers (string values from job args too)."""
+        template = tmp_path / "template.md"
+        template.write_text("---\nsubject: Test\n---\nBody")
+
+        recipients = tmp_path / "recipients.json"
+        recipients.write_text('[{"email": "a@example.com"}]')
+
+        with patch("life_jobs.email.ThreadPoolExecutor", wraps=email.ThreadPoolExecutor) as pool:
+            with patch("life_jobs.email._send_via_provider") as mock_send:
+                mock_send.return_value = {"sent": True, "subject": "Test", "error": None}
+                result = email.batch_send(
+                    account="test",
+                    template=str(template),
+                    recipients_file=str(recipients),
+                    max_workers="2",
+                )
+
+        pool.assert_called_once_with(max_workers=2)
+        assert result["sent"] == 1
+
+    @patch("life_jobs.email.GraphClient")
+    def test_batch_send_graph_batch(self, mock_client_class, tmp_path):
+        """Should send msgraph messages in $batch requests of GRAPH_BATCH_SIZE."""
+        template = tmp_path / "template.md"
+        template.write_text("---\nsubject: Hi {{ name }}\n---\nBody")
+
+        recipients = tmp_path / "recipients.json"
+        recipients.write_text(
+            json.dumps([{"email": f"user{i}@example.com", "name": str(i)} for i in range(25)])
+        )
+
+        def fake_post(endpoint, payload):
+            assert endpoint == "/$batch"
+            responses = [{"id": r["id"], "status": 202} for r in payload["requests"]]
+            if len(responses) == 5:
+                responses[1] = {"id": "1", "status": 400, "body": {"error": {"message": "Bad"}}}
+            return {"responses": responses}
+
+        mock_client = MagicMock()
+        mock_client.post.side_effect = fake_post
+        mock_client_class.from_authctl.return_value = mock_client
+
+        result = email.batch_send(
+            account="test",
+            template=str(template),
+            recipients_file=str(recipients),
+            graph_batch="true",
+        )
+
+        sizes = [len(call.args[1]["requests"]) for call in mock_client.post.call_args_list]
+        assert sizes == [20, 5]
+        first = mock_client.post.call_args_list[0].args[1]["requests"][0]
+        assert first["url"] == "/me/sendMail"
+        assert first["body"]["message"]["subject"] == "Hi 0"
+        assert result["sent"] == 24
+        assert result["failed"] == 1
+        assert result["errors"] == ["user21@example.com: Bad"]
+        assert [r["email"] for r in result["recipients"]][:2] == [
+            "user0@example.com",
+            "user1@example.com",
+        ]
+
+    @patch("life_jobs.email._send_via_provider")
+    @patch("life_jobs.email.GraphClient")
+    def test_batch_send_graph_batch_falls_back(
+        self, mock_client_class, mock_send_via_provider, tmp_path
+    ):
+        """Should send one by one if the $batch request fails."""
+        template = tmp_path / "template.md"
+        template.write_text("---\nsubject: Test\n---\nBody")
+
+        recipients = tmp_path / "recipients.json"
+        recipients.write_text('[{"email": "a@example.com"}, {"email": "b@example.com"}]')
+
+        mock_client_class.from_authctl.return_value.post.side_effect = Exception("No batch")
+        mock_send_via_provider.return_value = {"sent": True, "subject": "Test", "error": None}
+
+        result = email.batch_send(
+            account="test",
+            template=str(template),
+            recipients_file=str(recipients),
+            graph_batch=True,
+        )
+
+        assert mock_send_via_provider.call_count == 2
+        assert result["sent"] == 2
+        assert result["failed"] == 0
+
+    @patch("life_jobs.email._send_via_provider")
+    @patch("life_jobs.email.GraphClient")
+    def test_batch_send_graph_batch_bad_response_not_resent(
+        self, mock_client_class, mock_send_via_provider, tmp_path
+    ):
+        """Should report an unexpected $batch response without resending."""
+        template = tmp_path / "template.md"
+        template.write_text("---\nsubject: Test\n---\nBody")
+
+        recipients = tmp_path / "recipients.json"
+        recipients.write_text('[{"email": "a@example.com"}, {"email": "b@example.com"}]')
+
+        mock_client_class.from_authctl.return_value.post.return_value = {
+            "responses": [{"id": "0", "status": 202}, {"id": "x"}]
+        }
+
+        result = email.batch_send(
+            account="test",
+            template=str(template),
+            recipients_file=str(recipients),
+            graph_batch=True,
+        )
+
+        mock_send_via_provider.assert_not_called()
+        assert result["sent"] == 1
+        assert result["failed"] == 1
+        assert result["errors"] == ["b@example.com: No response for message in batch"]
+
+    @patch("life_jobs.email.GraphClient")
+    def test_batch_send_graph_batch_missing_emails_after_open_batch(
+        self, mock_client_class, tmp_path
+    ):
+        """Should not wait on an unsubmitted batch when invalid recipients follow it."""
+        template = tmp_path / "template.md"
+        template.write_text("---\nsubject: Test\n---\nBody")
+
+        recipients = tmp_path / "recipients.json"
+        recipients.write_text(
+            json.dumps(
+                [{"email": f"user{i}@example.com"} for i in range(5)]
+                + [{"name": str(i)} for i in range(60)]
+            )
+        )
+
+        mock_client_class.from_authctl.return_value.post.side_effect = lambda endpoint, payload: {
+            "responses": [{"id": r["id"], "status": 202} for r in payload["requests"]]
+        }
+
+        result = email.batch_send(
+            account="test",
+            template=str(template),
+            recipients_file=str(recipients),
+            graph_batch=True,
+            max_workers=1,
+        )
+
+        assert result["sent"] == 5
+        assert result["failed"] == 60
+        assert result["errors"][0] == "Missing email field in recipient: {'name': '0'}"
+
+
+class TestIterJsonArray:
+    """Tests for _iter_json_array() helper."""
+
+    def test_matches_json_loads_across_chunk_boundaries(self):
+        """Should yield the same items as json.loads for any chunk size."""
+        text = '[{"email": "a@example.com", "n": 1.5e3}, "x", [1, 2], null, true]'
+        for chunk_size in (1, 3, 7, 65536):
+            items = list(email._iter_json_array(io.StringIO(text), chunk_size))
+            assert items == json.loads(text)
+
+    def test_malformed_json_raises(self):
+        """Should raise JSONDecodeError like json.loads."""
+        for text in ("", "[1,]", "[1 2]", "[1] x"):
+            with pytest.raises(json.JSONDecodeError):
+                list(email._iter_json_array(io.StringIO(text), 2))
@@ -0,0 +1,71 @@
+"""Tests for life_jobs._output module.
+
+Copyright 2025 Ben Mensi
+Licensed under the Apache License, Version 2.0
+"""
+
+import json
+from datetime import date
+from unittest.mock import patch
+
+import pytest
+
+from life_jobs._output import load_records, write_json_records, write_records
+
+
+class TestWriteJsonRecords:
+    """Tests for write_json_records function."""
+
+    def test_matches_indented_json_dump(self, tmp_path):
+        """Should produce the same document as json.dumps(indent=2, default=str)."""
+        records = [
+            {"id": "1", "tags": ["a", "b"], "meta": {"note": "line1\nline2"}},
+            {"id": "2", "due": date(2025, 1, 15), "empty": {}},
+        ]
+        output_file = tmp_path / "nested" / "records.json"
+
+        count = write_json_records(output_file, records)
+
+        assert count == 2
+        assert output_file.read_text() == json.dumps(records, indent=2, default=str)
+
+    def test_empty_records(self, tmp_path):
+        """Should write an empty array."""
+        output_file = tmp_path / "records.json"
+
+        assert write_json_records(output_file, []) == 0
+        assert json.loads(output_file.read_text()) == []
+
+    def test_accepts_iterator(self, tmp_path):
+        """Should stream records from a generator and count them."""
+        output_file = tmp_path / "records.json"
+
+        count = write_json_records(output_file, ({"n": n} for n in range(3)))
+
+        assert count == 3
+        assert json.loads(output_file.read_text()) == [{"n": 0}, {"n": 1}, {"n": 2}]
+
+
+class TestMsgpackRecords:
+    """Tests for write_records/load_records with .msgpack paths."""
+
+    def test_json_path_round_trip(self, tmp_path):
+        """Should write and read JSON for non-.msgpack paths."""
+        output_file = tmp_path / "records.json"
+
+        assert write_records(output_file, [{"id": "1"}]) == 1
+        assert load_records(output_file) == [{"id": "1"}]
+
+    def test_msgpack_round_trip(self, tmp_path):
+        """Should write and read MessagePack for .msgpack paths."""
+        pytest.importorskip("msgspec")
+        output_file = tmp_path / "records.msgpack"
+
+        assert write_records(output_file, [{"id": "1", "n": 2}]) == 1
+        assert load_records(output_file) == [{"id": "1", "n": 2}]
+
+    def test_msgpack_requires_msgspec(self, tmp_path):
+        """Should raise a clear error when msgspec is not installed."""
+        with patch("life_jobs._output._msgspec", None):
+            with pytest.raises(ImportError, match="msgspec"):
+                write_records(tmp_path / "records.msgpack", [])
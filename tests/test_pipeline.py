@@ -440,8 +440,8 @@ class TestPipelineIntegration:
 
         mock_run_lorchestra.assert_called_once()
         call_kwargs = mock_run_lorchestra.call_args.kwargs
-        # Job runner passes strings, processor converts to bool
-        assert call_kwargs["dry_run"] == "true"
+        # Whole-placeholder args keep the variable's type
+        assert call_kwargs["dry_run"] is True
 
     def test_verbose_propagates_to_lorchestra(self, mock_run_lorchestra):
         """--verbose flag should be passed through to lorchestra."""
@@ -449,8 +449,8 @@ class TestPipelineIntegration:
 
         mock_run_lorchestra.assert_called_once()
         call_kwargs = mock_run_lorchestra.call_args.kwargs
-        # Job runner passes strings, processor converts to bool
-        assert call_kwargs["verbose"] == "true"
+        # Whole-placeholder args keep the variable's type
+        assert call_kwargs["verbose"] is True
 
     def test_failed_job_returns_nonzero_exit(self):
         """Failed lorchestra job should result in non-zero exit code."""
@@ -468,3 +468,24 @@ class TestPipelineIntegration:
 
         assert result.exit_code == 1
         assert "failed" in result.output
+
+    def test_result_output_unstyled_when_not_a_tty(self):
+        """Result summary should not contain ANSI escapes when piped."""
+        with patch("life_jobs.pipeline.run_lorchestra") as mock:
+            mock.return_value = {
+                "job_id": "pipeline.ingest",
+                "success": False,
+                "exit_code": 1,
+                "duration_ms": 1500,
+                "stdout": "",
+                "stderr": "",
+                "error_message": "lorchestra exited with code 1",
+            }
+            result = runner.invoke(app, ["pipeline", "ingest"])
+
+        assert result.output == (
+            "=== Pipeline: pipeline.ingest ===\n"
+            "Status: ✗ failed\n"
+            "Duration: 1.5s\n"
+            "Error: lorchestra exited with code 1\n"
+        )
@@ -3,11 +3,13 @@
 
 """Tests for registry.py module."""
 
+from unittest.mock import patch
 
 from life.registry import (
     TOOL_REGISTRY,
     ToolInfo,
     get_tool_info,
+    invalidate_tool_cache,
     is_tool_installed,
     list_tools,
     register_tool,
@@ -53,6 +55,20 @@ class TestIsToolInstalled:
         result = is_tool_installed("definitely-not-a-real-tool-xyz123")
         assert result is False
 
+    def test_path_lookup_is_cached(self):
+        """Test that repeated checks reuse the PATH lookup until invalidated."""
+        invalidate_tool_cache()
+        with patch("life.registry.shutil.which", return_value="/usr/bin/msg") as which:
+            assert is_tool_installed("msg") is True
+            assert is_tool_installed("msg") is True
+            assert which.call_count == 1
+
+            invalidate_tool_cache()
+            which.return_value = None
+            assert is_tool_installed("msg") is False
+            assert which.call_count == 2
+        invalidate_tool_cache()
+
 
 class TestGetToolInfo:
     """Test getting tool metadata."""
@@ -0,0 +1,203 @@
+# Copyright 2025 Ben Mensi
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for run command result formatting."""
+
+from unittest.mock import patch
+
+import pytest
+from typer.testing import CliRunner
+
+from life.cli import app
+from life.commands.run import _format_result, _get_console
+
+FORMATTED = "@OData.Community.Display.V1.FormattedValue"
+
+runner = CliRunner()
+
+
+def _print_result(result):
+    """Render a step result the way run_command does."""
+    _get_console().print(_format_result(result))
+
+
+@pytest.fixture
+def demo_config(tmp_path):
+    """A config file and patched jobs directory holding one demo job."""
+    jobs_dir = tmp_path / "jobs"
+    jobs_dir.mkdir()
+    (jobs_dir / "demo.yaml").write_text(
+        """
+jobs:
+  demo.greet:
+    steps:
+      - name: hello
+        call: life_jobs.shell.run
+        args:
+          command: "echo {name}"
+"""
+    )
+    config_file = tmp_path / "life.yml"
+    config_file.write_text(f"jobs:\n  event_log: {tmp_path / 'events.jsonl'}\n")
+
+    with patch("life.commands.run.get_jobs_dir", return_value=jobs_dir):
+        yield config_file
+
+
+class TestRunCommand:
+    """Test run command output."""
+
+    def test_dry_run_verbose_output(self, demo_config):
+        """Test the job summary printed for a verbose dry run."""
+        result = runner.invoke(
+            app,
+            [
+                "--config", str(demo_config), "--dry-run", "--verbose",
+                "run", "--var", "name=World", "demo.greet",
+            ],
+        )
+
+        assert result.exit_code == 0
+        lines = result.stdout.splitlines()
+        assert lines[0] == "[DRY RUN] Would execute job: demo.greet"
+        assert lines[1] == "Job: demo.greet"
+        assert lines[3:] == [
+            "Status: success",
+            "",
+            "  ○ Step 1: hello",
+            "    call: life_jobs.shell.run",
+            "    args: {'command': 'echo World'}",
+            "",
+            "[DRY RUN] No changes made",
+        ]
+
+    def test_var_value_may_contain_equals(self, demo_config):
+        """Test that only the first = separates a variable's key and value."""
+        result = runner.invoke(
+            app,
+            [
+                "--config", str(demo_config), "--dry-run", "--verbose",
+                "run", "--var", "name=a=b", "demo.greet",
+            ],
+        )
+
+        assert result.exit_code == 0
+        assert "args: {'command': 'echo a=b'}" in result.stdout
+
+    def test_var_without_equals_rejected(self, demo_config):
+        """Test that a --var without KEY=VALUE form is an error."""
+        result = runner.invoke(
+            app,
+            ["--config", str(demo_config), "run", "--var", "name", "demo.greet"],
+        )
+
+        assert result.exit_code == 1
+        assert "Invalid variable format 'name'" in result.output
+
+    def test_missing_jobs_dir(self, tmp_path):
+        """Test that a missing jobs directory is reported."""
+        missing = tmp_path / "no-jobs"
+        with patch("life.commands.run.get_jobs_dir", return_value=missing):
+            result = runner.invoke(app, ["run", "demo.greet"])
+
+        assert result.exit_code == 1
+        assert f"Jobs directory not found: {missing}" in result.output
+
+    def test_step_results_rendered_in_order(self, demo_config):
+        """Test that step lines and rich step results are printed in step order."""
+        job_result = {
+            "run_id": "r1",
+            "status": "success",
+            "steps": [
+                {"step": "query", "status": "success", "result": {"records": []}},
+                {"step": "report", "status": "success", "result": {"sent": 3}},
+                {"step": "done", "status": "success"},
+            ],
+        }
+        with patch("life.job_runner.run_job", return_value=job_result):
+            result = runner.invoke(app, ["--config", str(demo_config), "run", "demo.greet"])
+
+        assert result.exit_code == 0
+        lines = result.stdout.splitlines()
+        assert lines[4:] == [
+            "  ✓ Step 1: query",
+            "No records found",
+            "  ✓ Step 2: report",
+            "┌──────┬───┐",
+            "│ sent │ 3 │",
+            "└──────┴───┘",
+            "  ✓ Step 3: done",
+        ]
+
+
+class TestFormatResultRecords:
+    """Test table output for query results."""
+
+    def test_columns_skip_empty_ids_and_metadata(self, capsys):
+        """Test that only columns with data are shown, preferred first."""
+        records = [
+            {
+                "@odata.etag": "W/1",
+                "contactid": "abc",
+                "cre92_score": 3,
+                "emailaddress1": None,
+                "fullname": "Ann Lee",
+                "firstname": "Ann",
+            },
+            {
+                "@odata.etag": "W/2",
+                "contactid": "def",
+                "cre92_score": None,
+                "emailaddress1": "bob@example.com",
+                "fullname": "Bob Roe",
+                "firstname": "Bob",
+            },
+        ]
+        _print_result({"records": records, "count": 2})
+
+        out = capsys.readouterr().out
+        header = next(line for line in out.splitlines() if "fullname" in line)
+        assert header.index("fullname") < header.index("email") < header.index("score")
+        assert "firstname" not in out
+        assert "contactid" not in out
+        assert "odata" not in out
+        assert "2 records:" in out
+
+    def test_formatted_values_preferred(self, capsys):
+        """Test that OData formatted values replace raw values."""
+        records = [{"status": 1, f"status{FORMATTED}": "Active", "name": None}]
+        _print_result({"records": records})
+
+        out = capsys.readouterr().out
+        assert "Active" in out
+        assert "name" not in out
+
+    def test_no_records(self, capsys):
+        """Test the empty result message."""
+        _print_result({"records": [], "count": 0})
+        assert "No records found" in capsys.readouterr().out
+
+    def test_rows_capped(self, capsys, monkeypatch):
+        """Test that large results show a trailing count of hidden rows."""
+        monkeypatch.setattr("life.commands.run.MAX_DISPLAY_ROWS", 2)
+        records = [{"name": f"row{i}"} for i in range(5)]
+        _print_result({"records": records})
+
+        out = capsys.readouterr().out
+        assert "row1" in out
+        assert "row2" not in out
+        assert "... 3 more" in out
+        assert "5 records:" in out
+
+
+class TestFormatResultSingle:
+    """Test key/value output for single-record results."""
+
+    def test_single_record_hides_metadata(self, capsys):
+        """Test that OData metadata is dropped from single records."""
+        _print_result({"@odata.context": "x", "fullname": "Ann", f"x{FORMATTED}": "y"})
+
+        out = capsys.readouterr().out
+        assert "fullname" in out
+        assert "Ann" in out
+        assert "odata" not in out
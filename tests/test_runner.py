@@ -6,6 +6,7 @@
 import logging
 import subprocess
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -117,6 +118,16 @@ class TestCommandRunner:
         # Escaped braces become single braces, variables get substituted
         assert result == "echo {literal} and value in {json}"
 
+    def test_substitute_variables_single_pass(self):
+        """Test that substituted values are not expanded or unescaped again."""
+        runner = CommandRunner()
+
+        command = "echo {a} {b}"
+        variables = {"a": "{b}", "b": "{{x}}"}
+        result = runner.substitute_variables(command, variables)
+
+        assert result == "echo {b} {{x}}"
+
     def test_run_command_dry_run(self, caplog):
         """Test command execution in dry-run mode."""
         runner = CommandRunner(dry_run=True)
@@ -144,6 +155,25 @@ class TestCommandRunner:
         with pytest.raises(subprocess.CalledProcessError):
             runner.run("exit 1")
 
+    def test_run_simple_command_skips_shell(self):
+        """Test that commands without shell syntax are exec'd directly."""
+        runner = CommandRunner(dry_run=False)
+
+        with patch("life.runner.subprocess.run", wraps=subprocess.run) as run:
+            result = runner.run("echo 'a  b'")
+        assert run.call_args.args[0] == ["echo", "a  b"]
+        assert result.stdout == "a  b\n"
+
+    def test_run_shell_syntax_uses_shell(self):
+        """Test that pipes and other shell syntax still go through the shell."""
+        runner = CommandRunner(dry_run=False)
+
+        with patch("life.runner.subprocess.run", wraps=subprocess.run) as run:
+            result = runner.run("echo hello | tr a-z A-Z")
+        assert run.call_args.args[0] == "echo hello | tr a-z A-Z"
+        assert run.call_args.kwargs["shell"] is True
+        assert result.stdout == "HELLO\n"
+
     def test_run_command_with_substitution(self):
         """Test command execution with variable substitution."""
         runner = CommandRunner(dry_run=False)
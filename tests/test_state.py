@@ -4,8 +4,12 @@
 """Tests for state.py module."""
 
 import json
+import warnings
 from datetime import datetime
 from pathlib import Path
+from unittest.mock import patch
+
+import pytest
 
 from life.state import StateManager
 
@@ -73,6 +77,16 @@ class TestStateManager:
         after_naive = after.replace(tzinfo=None) if hasattr(after, 'tzinfo') else after
         assert before_naive <= last_run <= after_naive
 
+    def test_last_run_format_without_deprecation_warning(self, state_file):
+        """Test that last_run is a UTC ISO timestamp built without utcnow()."""
+        manager = StateManager(str(state_file))
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", DeprecationWarning)
+            manager.set_high_water_mark("task1", "modified_on", "2024-11-10T12:00:00Z")
+
+        last_run = manager.get_last_run("task1")
+        assert datetime.strptime(last_run, "%Y-%m-%dT%H:%M:%S.%fZ")
+
     def test_clear_task(self, state_file):
         """Test clearing task state."""
         manager = StateManager(str(state_file))
@@ -151,3 +165,116 @@ class TestStateManager:
         assert "modified_on" in data["task1"]
         assert "last_run" in data["task1"]
         assert data["task1"]["modified_on"] == "2024-11-10T12:00:00Z"
+
+    def test_context_manager_defers_save_until_exit(self, state_file):
+        """Test that updates inside a with block are written once on exit."""
+        with StateManager(str(state_file)) as manager:
+            manager.set_high_water_mark("task1", "modified_on", "2024-11-10T12:00:00Z")
+            manager.set_high_water_mark("task2", "modified_on", "2024-11-09T10:00:00Z")
+            assert not state_file.exists()
+
+        data = json.loads(state_file.read_text())
+        assert data["task1"]["modified_on"] == "2024-11-10T12:00:00Z"
+        assert data["task2"]["modified_on"] == "2024-11-09T10:00:00Z"
+
+    def test_flush_without_autosave(self, state_file):
+        """Test that autosave=False writes only on flush, and only when dirty."""
+        manager = StateManager(str(state_file), autosave=False)
+        manager.flush()
+        assert not state_file.exists()
+
+        manager.set_high_water_mark("task1", "modified_on", "2024-11-10T12:00:00Z")
+        assert not state_file.exists()
+
+        manager.flush()
+        assert StateManager(str(state_file)).get_high_water_mark(
+            "task1", "modified_on"
+        ) == "2024-11-10T12:00:00Z"
+
+    def test_failed_save_keeps_previous_state(self, state_file):
+        """Test that a failed write leaves the old file intact and no temp file."""
+        manager = StateManager(str(state_file))
+        manager.set_high_water_mark("task1", "modified_on", "2024-11-10T12:00:00Z")
+        before = state_file.read_bytes()
+
+        with patch("life.state.os.replace", side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                manager.set_high_water_mark("task1", "modified_on", "2024-11-11T12:00:00Z")
+
+        assert state_file.read_bytes() == before
+        assert list(state_file.parent.iterdir()) == [state_file]
+
+    def test_per_task_directory_layout(self, temp_dir):
+        """Test that a path ending in "/" stores each task in its own file."""
+        state_dir = temp_dir / "state"
+        manager = StateManager(f"{state_dir}/")
+        manager.set_high_water_mark("task1", "modified_on", "2024-11-10T12:00:00Z")
+        manager.set_high_water_mark("task2", "modified_on", "2024-11-09T10:00:00Z")
+
+        assert state_dir.is_dir()
+        task1 = json.loads((state_dir / "task1.json").read_text())
+        assert task1["modified_on"] == "2024-11-10T12:00:00Z"
+
+        reloaded = StateManager(str(state_dir))
+        assert reloaded.get_high_water_mark("task2", "modified_on") == "2024-11-09T10:00:00Z"
+
+    def test_per_task_update_rewrites_only_that_task(self, temp_dir):
+        """Test that updating one task leaves other task files untouched."""
+        state_dir = temp_dir / "state"
+        manager = StateManager(str(state_dir), per_task=True)
+        manager.set_high_water_mark("task1", "modified_on", "2024-11-10T12:00:00Z")
+        manager.set_high_water_mark("task2", "modified_on", "2024-11-09T10:00:00Z")
+
+        with patch("life.state._write_atomic") as write:
+            manager.set_high_water_mark("task2", "modified_on", "2024-11-11T10:00:00Z")
+        assert [call.args[0].name for call in write.call_args_list] == ["task2.json"]
+
+        manager.clear_task("task1")
+        assert not (state_dir / "task1.json").exists()
+        assert (state_dir / "task2.json").exists()
+
+    def test_suffixless_path_is_a_single_file(self, temp_dir):
+        """Test that a new path without a suffix is not treated as a directory."""
+        state_path = temp_dir / "state"
+        StateManager(str(state_path)).set_high_water_mark("task1", "id", "1")
+
+        assert state_path.is_file()
+        assert json.loads(state_path.read_text())["task1"]["id"] == "1"
+
+    def test_per_task_names_are_sanitized(self, temp_dir):
+        """Test that task names with path separators stay inside the directory."""
+        state_dir = temp_dir / "state"
+        manager = StateManager(str(state_dir), per_task=True)
+        manager.set_high_water_mark("crm/contacts", "id", "1")
+        manager.set_high_water_mark("..", "id", "2")
+
+        assert sorted(p.name for p in temp_dir.iterdir()) == ["state"]
+        reloaded = StateManager(str(state_dir))
+        assert set(reloaded.get_all_state()) == {"crm/contacts", ".."}
+        assert reloaded.get_high_water_mark("crm/contacts", "id") == "1"
+
+    def test_state_is_loaded_lazily(self, state_file):
+        """Test that the state file is not read until state is needed."""
+        StateManager(str(state_file)).set_high_water_mark("task1", "id", "1")
+
+        with patch.object(StateManager, "_load", return_value={}) as load:
+            manager = StateManager(str(state_file))
+            load.assert_not_called()
+            assert manager.get_all_state() == {}
+            load.assert_called_once()
+
+    def test_per_task_lookup_reads_only_that_task(self, temp_dir):
+        """Test that a per-task lookup doesn't load other tasks, and updates survive a load."""
+        state_dir = temp_dir / "state"
+        writer = StateManager(str(state_dir), per_task=True)
+        writer.set_high_water_mark("task1", "id", "1")
+        writer.set_high_water_mark("task2", "id", "2")
+
+        manager = StateManager(str(state_dir), autosave=False)
+        assert manager.get_high_water_mark("task1", "id") == "1"
+        assert set(manager._state) == {"task1"}
+
+        manager.set_high_water_mark("task1", "id", "10")
+        manager.clear_task("task2")
+        assert manager.get_all_state() == {"task1": manager._state["task1"]}
+        assert manager.get_high_water_mark("task1", "id") == "10"
@@ -29,6 +29,20 @@ class TestTodayHelpers:
         result = _get_daily_dir(config)
         assert result == str(Path.cwd() / "notes" / "daily")
 
+    def test_get_daily_dir_default_follows_chdir(self, tmp_path, monkeypatch):
+        """Test default daily dir tracks the current directory after chdir."""
+        _get_daily_dir({})
+        monkeypatch.chdir(tmp_path)
+        result = _get_daily_dir({})
+        assert result == str(tmp_path / "notes" / "daily")
+
+    def test_get_daily_dir_follows_home(self, tmp_path, monkeypatch):
+        """Test ~ in a configured daily dir tracks HOME after it changes."""
+        config = {"today": {"daily_dir": "~/notes"}}
+        _get_daily_dir(config)
+        monkeypatch.setenv("HOME", str(tmp_path))
+        assert _get_daily_dir(config) == str(tmp_path / "notes")
+
     def test_get_daily_dir_with_workspace(self):
         """Test getting daily dir uses workspace if defined."""
         config = {"workspace": "~/my-workspace"}
@@ -211,3 +211,7 @@ class TestSuggestFix:
         """Test case-insensitive suggestions."""
         suggestion = suggest_fix("SYNC", VALID_TOP_LEVEL_KEYS)
         assert suggestion == "sync"
+
+    def test_suggest_accepts_plain_set(self):
+        """Test that mutable option sets work despite the memoization."""
+        assert suggest_fix("mrege", {"sync", "merge"}) == "merge"